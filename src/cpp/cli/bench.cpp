@@ -4,14 +4,17 @@
 #include <CLI/CLI.hpp>
 #include <lemon/utils/path_utils.h>
 #include <algorithm>
+#include <atomic>
 #include <chrono>
 #include <cmath>
 #include <ctime>
+#include <deque>
 #include <filesystem>
 #include <fstream>
 #include <iomanip>
 #include <iostream>
 #include <sstream>
+#include <thread>
 #include <unordered_map>
 #include <unordered_set>
 
@@ -34,9 +37,8 @@ std::string get_timestamp_iso() {
     return std::string(buf);
 }
 
-static double percentile(std::vector<double> values, double p) {
+static double percentile_sorted(const std::vector<double>& values, double p) {
     if (values.empty()) return 0.0;
-    std::sort(values.begin(), values.end());
     if (values.size() == 1) return values[0];
     double index = (p / 100.0) * (static_cast<double>(values.size()) - 1.0);
     size_t lower = static_cast<size_t>(std::floor(index));
@@ -46,6 +48,42 @@ static double percentile(std::vector<double> values, double p) {
     return values[lower] * (1.0 - frac) + values[upper] * frac;
 }
 
+// Collect one metric from every run and derive all summary values from a
+// single sorted copy, instead of re-walking (and re-sorting) per statistic.
+static BenchMetricStats summarize_runs(const std::vector<BenchRunResult>& runs,
+                                       double BenchRunResult::*field) {
+    BenchMetricStats stats;
+    if (runs.empty()) return stats;
+
+    std::vector<double> values;
+    values.reserve(runs.size());
+    double sum = 0.0;
+    for (const auto& r : runs) {
+        values.push_back(r.*field);
+        sum += r.*field;
+    }
+    std::sort(values.begin(), values.end());
+
+    stats.mean = sum / runs.size();
+    stats.min = values.front();
+    stats.max = values.back();
+    stats.p50 = percentile_sorted(values, 50.0);
+    stats.p95 = percentile_sorted(values, 95.0);
+    return stats;
+}
+
+BenchMetricStats BenchScenarioResult::ttft_stats() const {
+    return summarize_runs(runs, &BenchRunResult::ttft_ms);
+}
+
+BenchMetricStats BenchScenarioResult::tps_stats() const {
+    return summarize_runs(runs, &BenchRunResult::tps);
+}
+
+BenchMetricStats BenchScenarioResult::duration_stats() const {
+    return summarize_runs(runs, &BenchRunResult::total_time_ms);
+}
+
 double BenchScenarioResult::ttft_mean_ms() const {
     if (runs.empty()) return 0.0;
     double sum = 0.0;
@@ -68,15 +106,11 @@ double BenchScenarioResult::ttft_max_ms() const {
 }
 
 double BenchScenarioResult::ttft_p50_ms() const {
-    std::vector<double> vals;
-    for (const auto& r : runs) vals.push_back(r.ttft_ms);
-    return percentile(vals, 50.0);
+    return ttft_stats().p50;
 }
 
 double BenchScenarioResult::ttft_p95_ms() const {
-    std::vector<double> vals;
-    for (const auto& r : runs) vals.push_back(r.ttft_ms);
-    return percentile(vals, 95.0);
+    return ttft_stats().p95;
 }
 
 double BenchScenarioResult::tps_mean() const {
@@ -101,15 +135,11 @@ double BenchScenarioResult::tps_max() const {
 }
 
 double BenchScenarioResult::tps_p50() const {
-    std::vector<double> vals;
-    for (const auto& r : runs) vals.push_back(r.tps);
-    return percentile(vals, 50.0);
+    return tps_stats().p50;
 }
 
 double BenchScenarioResult::tps_p95() const {
-    std::vector<double> vals;
-    for (const auto& r : runs) vals.push_back(r.tps);
-    return percentile(vals, 95.0);
+    return tps_stats().p95;
 }
 
 double BenchScenarioResult::vram_peak_gb() const {
@@ -167,23 +197,46 @@ std::string expand_context(const json& context_block, const std::vector<json>& m
     size_t filler_len = filler.size();
     if (filler_len == 0) return "";
 
-    std::string expanded;
-    expanded.reserve(target_chars);
     size_t reps = (target_chars + filler_len - 1) / filler_len;
-    for (size_t i = 0; i < reps; ++i) {
-        expanded += filler;
-    }
-
+    size_t filler_total = reps * filler_len;
     std::string question = extract_user_content(messages);
 
+    // Long-context prompts run to hundreds of KB; assemble the result in a
+    // single buffer rather than concatenating temporaries around the filler.
+    static const std::string separator = "\n\n";
+    std::string expanded;
+    expanded.reserve(filler_total + question.size() + 2 * separator.size());
+
+    auto append_filler = [&](size_t chars) {
+        while (chars >= filler_len) {
+            expanded += filler;
+            chars -= filler_len;
+        }
+        expanded.append(filler, 0, chars);
+    };
+
     if (position == "start") {
-        return question + "\n\n" + expanded;
+        expanded += question;
+        expanded += separator;
+        append_filler(filler_total);
     } else if (position == "middle") {
-        size_t mid = expanded.size() / 2;
-        return expanded.substr(0, mid) + "\n\n" + question + "\n\n" + expanded.substr(mid);
+        size_t mid = filler_total / 2;
+        append_filler(mid);
+        expanded += separator;
+        expanded += question;
+        expanded += separator;
+        // Continue the filler from where the first half stopped.
+        size_t offset = mid % filler_len;
+        size_t remaining = filler_total - mid;
+        size_t head = std::min(remaining, filler_len - offset);
+        expanded.append(filler, offset, head);
+        append_filler(remaining - head);
     } else {
-        return expanded + "\n\n" + question;
+        append_filler(filler_total);
+        expanded += separator;
+        expanded += question;
     }
+    return expanded;
 }
 
 static std::vector<BenchScenario> parse_scenario_file(const std::string& path) {
@@ -232,7 +285,7 @@ static std::vector<BenchScenario> parse_scenario_file(const std::string& path) {
                 for (auto& msg : scenario.messages) {
                     if (msg.contains("role") && msg["role"] == "user") {
                         if (msg.contains("content") && msg["content"].is_string()) {
-                            msg["content"] = expanded;
+                            msg["content"] = std::move(expanded);
                         }
                         break;
                     }
@@ -337,22 +390,17 @@ static std::vector<BenchScenario> exclude_category(const std::vector<BenchScenar
 }
 
 
-std::vector<BackendDiscovery> discover_backends(lemonade::LemonadeClient& client,
-                                                const std::string& model,
+std::vector<BackendDiscovery> discover_backends(const json& sys_info,
+                                                const json& model_info,
                                                 const std::vector<std::string>& requested) {
     std::vector<BackendDiscovery> result;
 
     try {
-        std::string response = client.make_request("/api/v1/system-info", "GET", "", "", 10000, 10000);
-        auto sys_info = json::parse(response);
-
         if (!sys_info.contains("recipes") || !sys_info["recipes"].is_object()) {
             std::cerr << "Warning: No recipes found in system-info" << std::endl;
             return result;
         }
 
-        // Also get model info to find its recipe
-        json model_info = client.get_model_info(model);
         std::string model_recipe;
         if (model_info.contains("recipe") && model_info["recipe"].is_string()) {
             model_recipe = model_info["recipe"].get<std::string>();
@@ -391,6 +439,22 @@ std::vector<BackendDiscovery> discover_backends(lemonade::LemonadeClient& client
     return result;
 }
 
+static json fetch_system_info(lemonade::LemonadeClient& client) {
+    std::string response = client.make_request("/api/v1/system-info", "GET", "", "", 10000, 10000);
+    return json::parse(response);
+}
+
+std::vector<BackendDiscovery> discover_backends(lemonade::LemonadeClient& client,
+                                                const std::string& model,
+                                                const std::vector<std::string>& requested) {
+    try {
+        return discover_backends(fetch_system_info(client), client.get_model_info(model), requested);
+    } catch (const std::exception& e) {
+        std::cerr << "Warning: Failed to discover backends: " << e.what() << std::endl;
+    }
+    return {};
+}
+
 
 // Map recipe name to the recipe_options key for custom args
 static const std::map<std::string, std::string> RECIPE_ARGS_KEY = {
@@ -400,36 +464,48 @@ static const std::map<std::string, std::string> RECIPE_ARGS_KEY = {
     {"whispercpp", "whispercpp_args"},
 };
 
+std::string build_load_request_body(const std::string& model,
+                                    const std::string& recipe,
+                                    const std::string& backend,
+                                    int ctx_size,
+                                    const std::string& backend_args) {
+    json request_body;
+    request_body["model_name"] = model;
+    request_body["save_options"] = false;
+
+    // For recipes that expose a selectable backend, pass the override.
+    if (const auto* desc = lemon::backends::descriptor_for(recipe);
+        desc && desc->selectable_backend) {
+        request_body[desc->effective_config_section() + "_backend"] = backend;
+    }
+
+    if (ctx_size > 0) {
+        request_body["ctx_size"] = ctx_size;
+    }
+
+    // Pass backend-specific custom args if provided
+    if (!backend_args.empty()) {
+        auto it = RECIPE_ARGS_KEY.find(recipe);
+        if (it != RECIPE_ARGS_KEY.end()) {
+            request_body[it->second] = backend_args;
+            // Disable merge so explicit benchmark args fully override defaults
+            request_body["merge_args"] = false;
+        }
+    }
+
+    return request_body.dump();
+}
+
 bool load_model_for_backend(lemonade::LemonadeClient& client,
                             const std::string& model,
                             const std::string& recipe,
                             const std::string& backend,
                             int ctx_size,
-                            const std::string& backend_args) {
+                            const std::string& backend_args,
+                            const std::string& request_body) {
     try {
-        json request_body;
-        request_body["model_name"] = model;
-        request_body["save_options"] = false;
-
-        // For recipes that expose a selectable backend, pass the override.
-        if (const auto* desc = lemon::backends::descriptor_for(recipe);
-            desc && desc->selectable_backend) {
-            request_body[desc->effective_config_section() + "_backend"] = backend;
-        }
-
-        if (ctx_size > 0) {
-            request_body["ctx_size"] = ctx_size;
-        }
-
-        // Pass backend-specific custom args if provided
-        if (!backend_args.empty()) {
-            auto it = RECIPE_ARGS_KEY.find(recipe);
-            if (it != RECIPE_ARGS_KEY.end()) {
-                request_body[it->second] = backend_args;
-                // Disable merge so explicit benchmark args fully override defaults
-                request_body["merge_args"] = false;
-            }
-        }
+        const std::string body = request_body.empty()
+            ? build_load_request_body(model, recipe, backend, ctx_size, backend_args) : request_body;
 
         BenchBackendResult tmp;
         tmp.recipe = recipe;
@@ -439,7 +515,7 @@ bool load_model_for_backend(lemonade::LemonadeClient& client,
         std::cout << "  Loading model with " << tmp.label() << "..." << std::flush;
 
         // Long timeout for model loading
-        client.make_request("/api/v1/load", "POST", request_body.dump(), "application/json",
+        client.make_request("/api/v1/load", "POST", body, "application/json",
                             86400000, 86400000);
 
         std::cout << " done" << std::endl;
@@ -525,44 +601,65 @@ static void compute_tps_from_tokens_and_time(BenchRunResult& result) {
     }
 }
 
+// Parse a chat/embeddings response. Unless the response text is being
+// captured, only the timing and usage blocks are read, so the generated
+// content (or embedding vectors) is discarded during parsing instead of being
+// built into a DOM that is thrown away.
+static json parse_bench_response(const std::string& response, bool capture_response) {
+    if (capture_response) {
+        return json::parse(response);
+    }
+    return json::parse(response, [](int depth, json::parse_event_t event, json& parsed) {
+        if (depth == 1 && event == json::parse_event_t::key) {
+            const auto& key = parsed.get_ref<const std::string&>();
+            return key == "timings" || key == "usage";
+        }
+        return true;
+    });
+}
+
+std::string build_bench_request_body(const std::string& model, const BenchScenario& scenario) {
+    json request_body;
+    request_body["model"] = model;
+    if (scenario.category == "embed") {
+        request_body["input"] = scenario.input;  // may be string or array
+    } else {
+        request_body["messages"] = scenario.messages;
+        request_body["max_completion_tokens"] = scenario.max_tokens;
+        request_body["temperature"] = 0;
+    }
+    return request_body.dump();
+}
+
 BenchRunResult run_single_bench(lemonade::LemonadeClient& client,
                                 const std::string& model,
                                 const BenchScenario& scenario,
                                 bool memory_tracking,
-                                bool capture_response) {
+                                bool capture_response,
+                                const std::string& request_body) {
     if (scenario.category == "embed")
-        return run_single_bench_embed(client, model, scenario, memory_tracking, capture_response);
+        return run_single_bench_embed(client, model, scenario, memory_tracking, capture_response, request_body);
     // default mode is text generation
-    return run_single_bench_textgen(client, model, scenario, memory_tracking, capture_response);
+    return run_single_bench_textgen(client, model, scenario, memory_tracking, capture_response, request_body);
 }
 
 BenchRunResult run_single_bench_textgen(lemonade::LemonadeClient& client,
                                 const std::string& model,
                                 const BenchScenario& scenario,
                                 bool memory_tracking,
-                                bool capture_response) {
+                                bool capture_response,
+                                const std::string& request_body) {
     BenchRunResult result;
     result.success = false;  // assume failure until proven otherwise
 
-    // Warmup memory stats query (discard — we take post-run snapshot)
-    if (memory_tracking) {
-        double _vram, _mem;
-        query_system_stats(client, _vram, _mem);
-    }
-
-    json request_body;
-    request_body["model"] = model;
-    request_body["messages"] = scenario.messages;
-    request_body["max_completion_tokens"] = scenario.max_tokens;
-    request_body["temperature"] = 0;
-
-    std::string body = request_body.dump();
+    const std::string body = request_body.empty()
+        ? build_bench_request_body(model, scenario) : request_body;
     auto start = steady_clock::now();
 
     try {
         std::string response = client.make_request("/api/v1/chat/completions", "POST", body, "application/json",
                                                    300000, 300000);
-        auto resp_json = json::parse(response);
+        auto resp_json = parse_bench_response(response, capture_response);
 
         if (capture_response) {
             if (resp_json.contains("output")) {
@@ -603,19 +700,19 @@ BenchRunResult run_single_bench_textgen(lemonade::LemonadeClient& client,
     // Last resort: derive TPS from total time
     compute_tps_from_tokens_and_time(result);
 
-    // Query memory after
-    if (memory_tracking)
-        extract_mem_use_into_result(client, result);
-
     // Validate: if all key metrics are zero the run failed server-side
-    // (e.g. context size mismatch, model error). VRAM is excluded — it's
-    // always reported correctly even for failed runs.
+    // (e.g. context size mismatch, model error).
     if (result.ttft_ms <= 0 && result.tps <= 0 &&
         result.input_tokens <= 0 && result.output_tokens <= 0) {
         std::cerr << "    Benchmark run failed (all metrics zero)" << std::endl;
         return result;  // success stays false
     }
 
+    // Query memory after. Failed runs are excluded from stats, so they
+    // (like warmup runs) skip the system-stats round trip.
+    if (memory_tracking)
+        extract_mem_use_into_result(client, result);
+
     result.success = true;
     return result;
 }
@@ -624,20 +721,13 @@ BenchRunResult run_single_bench_embed(lemonade::LemonadeClient& client,
                                 const std::string& model,
                                 const BenchScenario& scenario,
                                 bool memory_tracking,
-                                bool capture_response) {
+                                bool capture_response,
+                                const std::string& request_body) {
     BenchRunResult result;
     result.success = false;
 
-    if (memory_tracking) {
-        double _vram, _mem;
-        query_system_stats(client, _vram, _mem);
-    }
-
-    json request_body;
-    request_body["model"] = model;
-    request_body["input"] = scenario.input;  // may be string or array
-
-    std::string body = request_body.dump();
+    const std::string body = request_body.empty()
+        ? build_bench_request_body(model, scenario) : request_body;
 
     // Timing setup
     auto start = steady_clock::now();
@@ -647,7 +737,7 @@ BenchRunResult run_single_bench_embed(lemonade::LemonadeClient& client,
             "/api/v1/embeddings", "POST", body, "application/json",
             300000, 300000);
 
-        auto resp_json = json::parse(response);
+        auto resp_json = parse_bench_response(response, capture_response);
 
         if (capture_response) {
             if (resp_json.contains("data") && !resp_json["data"].empty()) {
@@ -689,6 +779,63 @@ BenchRunResult run_single_bench_embed(lemonade::LemonadeClient& client,
     return result;
 }
 
+// Adaptive warmup looks at this many of the most recent warmup TTFTs.
+static const size_t ADAPTIVE_WARMUP_WINDOW = 5;
+
+// Warmup cap used with --adaptive-warmup when no --warmup count is given.
+static const int DEFAULT_ADAPTIVE_WARMUP_CAP = 10;
+
+// Population standard deviation divided by the mean; 0 when the mean is 0.
+static double relative_stdev(const std::deque<double>& values) {
+    if (values.empty()) return 0.0;
+    double sum = 0.0;
+    for (double v : values) sum += v;
+    double mean = sum / values.size();
+    if (mean <= 0.0) return 0.0;
+    double sq_sum = 0.0;
+    for (double v : values) sq_sum += (v - mean) * (v - mean);
+    return std::sqrt(sq_sum / values.size()) / mean;
+}
+
+// Issue `runs` measurement requests with up to `concurrency` in flight, so the
+// server's batching path is exercised. LemonadeClient keeps its connections
+// per thread, so it is safe to share across workers. Results keep run order.
+static std::vector<BenchRunResult> run_concurrent_benches(lemonade::LemonadeClient& client,
+                                                          const std::string& model,
+                                                          const BenchScenario& scenario,
+                                                          int runs,
+                                                          int concurrency,
+                                                          bool memory_tracking,
+                                                          bool capture_response,
+                                                          const std::string& request_body) {
+    std::vector<BenchRunResult> results(runs);
+    std::atomic<int> next_run{0};
+
+    auto worker = [&]() {
+        for (int i = next_run++; i < runs; i = next_run++) {
+            results[i] = run_single_bench(client, model, scenario, memory_tracking,
+                                          capture_response, request_body);
+        }
+    };
+
+    std::cout << "    Running " << runs << " requests, " << concurrency << " in flight..." << std::flush;
+    auto start = steady_clock::now();
+
+    std::vector<std::thread> workers;
+    const int num_workers = std::min(concurrency, runs);
+    workers.reserve(num_workers);
+    for (int w = 0; w < num_workers; ++w) {
+        workers.emplace_back(worker);
+    }
+    for (auto& t : workers) {
+        t.join();
+    }
+
+    double elapsed_s = duration<double>(steady_clock::now() - start).count();
+    std::cout << " done in " << std::fixed << std::setprecision(1) << elapsed_s << "s" << std::endl;
+    return results;
+}
+
 BenchScenarioResult run_scenario(lemonade::LemonadeClient& client,
                                  const std::string& model,
                                  const BenchScenario& scenario,
@@ -701,49 +848,93 @@ BenchScenarioResult run_scenario(lemonade::LemonadeClient& client,
                                  int ctx_size,
                                  const std::string& backend_args,
                                  const std::string& response_log_path,
-                                 const std::string& response_timestamp) {
+                                 const std::string& response_timestamp,
+                                 int concurrency,
+                                 const std::string& prebuilt_request_body,
+                                 bool adaptive_warmup,
+                                 double warmup_rsd_threshold) {
     BenchScenarioResult result;
     result.scenario_name = scenario.name;
     result.category = scenario.category;
 
+    // The payload is identical for every warmup and measurement run; long-context
+    // scenarios can be hundreds of KB, so serialize it once up front.
+    const std::string request_body = prebuilt_request_body.empty()
+        ? build_bench_request_body(model, scenario) : prebuilt_request_body;
+
+    // Likewise the load request, which is re-sent before every run when reloading.
+    const std::string load_body = build_load_request_body(model, recipe, backend, ctx_size, backend_args);
+
     // Load model (once if not reloading, or before each run if reloading)
     bool loaded = false;
     if (!reload) {
         unload_all_models(client);
-        loaded = load_model_for_backend(client, model, recipe, backend, ctx_size, backend_args);
+        loaded = load_model_for_backend(client, model, recipe, backend, ctx_size, backend_args, load_body);
         if (!loaded) {
             std::cerr << "    Model failed to load, skipping scenario." << std::endl;
             return result;
         }
     }
 
-    // Warmup runs
+    // Warmup runs. Adaptive warmup stops early once the recent TTFTs agree.
+    std::deque<double> recent_ttft;
     for (int i = 0; i < warmup; ++i) {
         if (reload) {
             unload_all_models(client);
-            if (!load_model_for_backend(client, model, recipe, backend, ctx_size, backend_args)) {
+            if (!load_model_for_backend(client, model, recipe, backend, ctx_size, backend_args, load_body)) {
                 result.failed_runs++;
                 continue;
             }
         }
         std::cout << "    Warmup " << (i + 1) << "/" << warmup << "..." << std::flush;
-        run_single_bench(client, model, scenario, false, false);
+        auto warmup_result = run_single_bench(client, model, scenario, false, false, request_body);
+
+        if (adaptive_warmup && warmup_result.success) {
+            recent_ttft.push_back(warmup_result.ttft_ms);
+            if (recent_ttft.size() > ADAPTIVE_WARMUP_WINDOW) {
+                recent_ttft.pop_front();
+            }
+            if (recent_ttft.size() == ADAPTIVE_WARMUP_WINDOW) {
+                double rsd = relative_stdev(recent_ttft);
+                if (rsd < warmup_rsd_threshold) {
+                    std::cout << " done (TTFT stable, RSD=" << std::fixed << std::setprecision(1)
+                              << rsd * 100.0 << "%)" << std::endl;
+                    break;
+                }
+            }
+        }
         std::cout << " done" << std::endl;
     }
 
-    // Measurement runs
+    // Measurement runs. Concurrent runs are all issued up front and then
+    // reported below in run order, like sequential ones.
+    const bool concurrent = !reload && concurrency > 1 && runs > 1;
+    std::vector<BenchRunResult> concurrent_results;
+    if (concurrent) {
+        concurrent_results = run_concurrent_benches(client, model, scenario, runs, concurrency,
+                                                    memory_tracking, !response_log_path.empty(),
+                                                    request_body);
+    }
+
     for (int i = 0; i < runs; ++i) {
-        if (reload) {
-            unload_all_models(client);
-            if (!load_model_for_backend(client, model, recipe, backend, ctx_size, backend_args)) {
-                std::cerr << "    Run " << (i + 1) << "/" << runs << "... FAILED to load model" << std::endl;
-                result.failed_runs++;
-                continue;
+        BenchRunResult run_result;
+        if (concurrent) {
+            std::cout << "    Run " << (i + 1) << "/" << runs << "..." << std::flush;
+            run_result = std::move(concurrent_results[i]);
+        } else {
+            if (reload) {
+                unload_all_models(client);
+                if (!load_model_for_backend(client, model, recipe, backend, ctx_size, backend_args, load_body)) {
+                    std::cerr << "    Run " << (i + 1) << "/" << runs << "... FAILED to load model" << std::endl;
+                    result.failed_runs++;
+                    continue;
+                }
             }
-        }
 
-        std::cout << "    Run " << (i + 1) << "/" << runs << "..." << std::flush;
-        auto run_result = run_single_bench(client, model, scenario, memory_tracking, !response_log_path.empty());
+            std::cout << "    Run " << (i + 1) << "/" << runs << "..." << std::flush;
+            run_result = run_single_bench(client, model, scenario, memory_tracking, !response_log_path.empty(),
+                                          request_body);
+        }
         if (!run_result.success) {
             result.failed_runs++;
             std::cout << " FAILED (excluded from stats)" << std::endl;
@@ -825,10 +1016,12 @@ static std::string fmt_vram_change(std::optional<double> val) {
 }
 
 static void print_scenario_row(const BenchScenarioResult& scenario, bool use_percentiles) {
-    double ttft_1 = use_percentiles ? scenario.ttft_p50_ms() : scenario.ttft_min_ms();
-    double ttft_2 = use_percentiles ? scenario.ttft_p95_ms() : scenario.ttft_max_ms();
-    double tps_1 = use_percentiles ? scenario.tps_p50() : scenario.tps_min();
-    double tps_2 = use_percentiles ? scenario.tps_p95() : scenario.tps_max();
+    const BenchMetricStats ttft = scenario.ttft_stats();
+    const BenchMetricStats tps = scenario.tps_stats();
+    double ttft_1 = use_percentiles ? ttft.p50 : ttft.min;
+    double ttft_2 = use_percentiles ? ttft.p95 : ttft.max;
+    double tps_1 = use_percentiles ? tps.p50 : tps.min;
+    double tps_2 = use_percentiles ? tps.p95 : tps.max;
     std::string name = scenario.scenario_name;
     if (scenario.failed_runs > 0) {
         name += " *" + std::to_string(scenario.failed_runs) + "f";
@@ -846,10 +1039,10 @@ static void print_scenario_row(const BenchScenarioResult& scenario, bool use_per
                   << std::endl;
     } else {
         std::cout << std::left << std::setw(20) << name
-                  << std::setw(8) << fmt_double(scenario.ttft_mean_ms())
+                  << std::setw(8) << fmt_double(ttft.mean)
                   << std::setw(8) << fmt_double(ttft_1)
                   << std::setw(8) << fmt_double(ttft_2)
-                  << std::setw(8) << fmt_double(scenario.tps_mean())
+                  << std::setw(8) << fmt_double(tps.mean)
                   << std::setw(8) << fmt_double(tps_1)
                   << std::setw(8) << fmt_double(tps_2)
                   << std::setw(8) << fmt_vram(scenario.vram_peak_gb())
@@ -889,6 +1082,17 @@ void print_table(const std::vector<BenchBackendResult>& results, const std::stri
     std::cout << std::endl;
 }
 
+// Concurrent requests share one loaded model, so they cannot reload per run.
+static bool effective_reload(const BenchConfig& config) {
+    return config.reload && config.concurrency <= 1;
+}
+
+// With reload, every warmup run starts a fresh backend, so the TTFT spread
+// describes cold starts and can never show the model settling in.
+static bool effective_adaptive_warmup(const BenchConfig& config) {
+    return config.adaptive_warmup && !effective_reload(config);
+}
+
 json to_json(const std::vector<BenchBackendResult>& results,
              const std::string& model,
              const std::string& timestamp,
@@ -901,6 +1105,10 @@ json to_json(const std::vector<BenchBackendResult>& results,
     config_json["warmup_runs"] = config.warmup_runs;
     config_json["measurement_runs"] = config.measurement_runs;
     config_json["memory_tracking"] = config.memory_tracking;
+    config_json["concurrency"] = config.concurrency;
+    // Record what actually ran: reload mode turns adaptive warmup off.
+    config_json["adaptive_warmup"] = effective_adaptive_warmup(config);
+    config_json["warmup_rsd_threshold"] = config.warmup_rsd_threshold;
     output["config"] = config_json;
 
     json results_json = json::array();
@@ -924,40 +1132,18 @@ json to_json(const std::vector<BenchBackendResult>& results,
                 // distinguishable from a valid 0ms/0tps measurement.
                 s_json["all_runs_failed"] = true;
             } else {
-                json ttft_stats;
-                ttft_stats["mean"] = scenario.ttft_mean_ms();
-                ttft_stats["min"] = scenario.ttft_min_ms();
-                ttft_stats["max"] = scenario.ttft_max_ms();
-                ttft_stats["p50"] = scenario.ttft_p50_ms();
-                ttft_stats["p95"] = scenario.ttft_p95_ms();
-                s_json["ttft_ms"] = ttft_stats;
-
-                std::vector<double> duration_vals;
-                duration_vals.reserve(scenario.runs.size());
-                double duration_sum = 0.0;
-                double duration_min = scenario.runs[0].total_time_ms;
-                double duration_max = scenario.runs[0].total_time_ms;
-                for (const auto& run : scenario.runs) {
-                    duration_vals.push_back(run.total_time_ms);
-                    duration_sum += run.total_time_ms;
-                    if (run.total_time_ms < duration_min) duration_min = run.total_time_ms;
-                    if (run.total_time_ms > duration_max) duration_max = run.total_time_ms;
-                }
-                json duration_stats;
-                duration_stats["mean"] = duration_sum / static_cast<double>(scenario.runs.size());
-                duration_stats["min"] = duration_min;
-                duration_stats["max"] = duration_max;
-                duration_stats["p50"] = percentile(duration_vals, 50.0);
-                duration_stats["p95"] = percentile(duration_vals, 95.0);
-                s_json["duration_ms"] = duration_stats;
-
-                json tps_stats;
-                tps_stats["mean"] = scenario.tps_mean();
-                tps_stats["min"] = scenario.tps_min();
-                tps_stats["max"] = scenario.tps_max();
-                tps_stats["p50"] = scenario.tps_p50();
-                tps_stats["p95"] = scenario.tps_p95();
-                s_json["tps"] = tps_stats;
+                auto stats_json = [](const BenchMetricStats& stats) {
+                    json out;
+                    out["mean"] = stats.mean;
+                    out["min"] = stats.min;
+                    out["max"] = stats.max;
+                    out["p50"] = stats.p50;
+                    out["p95"] = stats.p95;
+                    return out;
+                };
+                s_json["ttft_ms"] = stats_json(scenario.ttft_stats());
+                s_json["duration_ms"] = stats_json(scenario.duration_stats());
+                s_json["tps"] = stats_json(scenario.tps_stats());
 
                 double vram_peak = scenario.vram_peak_gb();
                 if (vram_peak >= 0) s_json["vram_peak_gb"] = vram_peak;
@@ -1270,6 +1456,18 @@ int handle_bench_command(lemonade::LemonadeClient& client, const BenchConfig& co
 
     const std::string command_timestamp = get_timestamp_iso();
 
+    const bool reload = effective_reload(config);
+    if (config.reload && !reload) {
+        std::cout << "Note: --concurrency " << config.concurrency
+                  << " implies --no-reload." << std::endl;
+    }
+
+    const bool adaptive_warmup = effective_adaptive_warmup(config);
+    if (config.adaptive_warmup && !adaptive_warmup) {
+        std::cout << "Note: --adaptive-warmup requires --no-reload; using a fixed warmup count."
+                  << std::endl;
+    }
+
     if (!config.response_log.empty()) {
         try {
             std::filesystem::path response_log_path(config.response_log);
@@ -1367,6 +1565,16 @@ int handle_bench_command(lemonade::LemonadeClient& client, const BenchConfig& co
         return 1;
     }
 
+    // System info (installed recipes/backends) does not change during the
+    // command, and preflight already fetched each model's info, so backend
+    // discovery needs no further requests per model.
+    json system_info = json::object();
+    try {
+        system_info = fetch_system_info(client);
+    } catch (const std::exception& e) {
+        std::cerr << "Warning: Failed to discover backends: " << e.what() << std::endl;
+    }
+
     struct ModelBenchResult {
         std::string model;
         std::string timestamp;
@@ -1386,7 +1594,7 @@ int handle_bench_command(lemonade::LemonadeClient& client, const BenchConfig& co
         const std::string model_timestamp = get_timestamp_iso();
 
         // Discover backends for this model
-        auto backends = discover_backends(client, model, config.backends);
+        auto backends = discover_backends(system_info, model_info, config.backends);
         if (backends.empty()) {
             std::cerr << "Error: No suitable backends found for model '" << model << "'." << std::endl;
             return 1;
@@ -1406,6 +1614,14 @@ int handle_bench_command(lemonade::LemonadeClient& client, const BenchConfig& co
             ctx_sizes = {default_ctx};
         }
 
+        // Request bodies depend only on the model and scenario, so serialize
+        // them once here rather than for every backend/ctx-size/args combination.
+        std::vector<std::string> request_bodies;
+        request_bodies.reserve(scenarios.size());
+        for (const auto& scenario : scenarios) {
+            request_bodies.push_back(build_bench_request_body(model, scenario));
+        }
+
         std::vector<BenchBackendResult> all_results;
 
         for (const auto& [recipe, backend] : backends) {
@@ -1435,7 +1651,8 @@ int handle_bench_command(lemonade::LemonadeClient& client, const BenchConfig& co
                     backend_result.ctx_size = ctx_size;
                     backend_result.backend_args = recipe_args;
 
-                    for (const auto& scenario : scenarios) {
+                    for (size_t si = 0; si < scenarios.size(); ++si) {
+                        const auto& scenario = scenarios[si];
                         std::cout << "  Scenario: " << scenario.name << " (" << scenario.category << ")" << std::endl;
 
                         int warmup = scenario.warmup_runs;
@@ -1445,10 +1662,16 @@ int handle_bench_command(lemonade::LemonadeClient& client, const BenchConfig& co
                         if (config.warmup_runs > 0) warmup = config.warmup_runs;
                         if (config.measurement_runs > 0) runs = config.measurement_runs;
 
+                        // Adaptive warmup treats the count as a cap, so give it room.
+                        if (adaptive_warmup && warmup == 0) warmup = DEFAULT_ADAPTIVE_WARMUP_CAP;
+
                         auto scenario_result = run_scenario(client, model, scenario, warmup, runs,
-                                                            config.memory_tracking, config.reload, recipe, backend, ctx_size, recipe_args,
+                                                            config.memory_tracking, reload, recipe, backend, ctx_size, recipe_args,
                                                             config.response_log,
-                                                            command_timestamp);
+                                                            command_timestamp, config.concurrency,
+                                                            request_bodies[si],
+                                                            adaptive_warmup,
+                                                            config.warmup_rsd_threshold);
                         backend_result.scenarios.push_back(scenario_result);
                     }
 
@@ -1645,7 +1868,17 @@ CLI::App* register_bench_command(CLI::App& parent,
         ->type_name("SIZE")
         ->multi_option_policy(CLI::MultiOptionPolicy::TakeAll);
     cmd->add_option("--runs", opts.runs, "Number of measurement runs per scenario (default: 3)")->type_name("N");
+    cmd->add_option("--concurrency", opts.concurrency,
+        "Number of measurement requests kept in flight at once; values above 1 imply --no-reload (default: 1)")
+        ->type_name("N")
+        ->check(CLI::PositiveNumber);
     cmd->add_option("--warmup", opts.warmup, "Number of warmup runs per scenario (default: 0)")->type_name("N");
+    cmd->add_flag("--adaptive-warmup", opts.adaptive_warmup,
+        "Keep warming up until recent TTFTs are stable; --warmup becomes the cap (default cap: 10). Requires --no-reload");
+    cmd->add_option("--warmup-rsd-threshold", opts.warmup_rsd_threshold,
+        "Relative standard deviation of recent warmup TTFTs treated as stable by --adaptive-warmup (default: 0.05)")
+        ->type_name("FRACTION")
+        ->check(CLI::PositiveNumber);
     cmd->add_option("--scenarios", opts.scenario_names,
         "Scenario name(s) or category to run (e.g. chat, coding, long-context). "
         "Use 'all' to include every scenario including long-context. "
@@ -1687,6 +1920,9 @@ BenchConfig build_bench_config(const std::string& output_file,
     config.ctx_sizes = cli.ctx_sizes;
     config.warmup_runs = cli.warmup;
     config.measurement_runs = cli.runs;
+    config.concurrency = cli.concurrency;
+    config.adaptive_warmup = cli.adaptive_warmup;
+    config.warmup_rsd_threshold = cli.warmup_rsd_threshold;
     config.json_output = cli.json_output;
     config.output_file = output_file;
     config.scenario_file = cli.scenario_file;
@@ -3,6 +3,8 @@
 #include <iostream>
 #include <algorithm>
 #include <iomanip>
+#include <map>
+#include <memory>
 #include <regex>
 #include <sstream>
 #include <nlohmann/json.hpp>
@@ -21,10 +23,20 @@ static std::regex build_name_filter_regex(const std::string& name_filter) {
     std::string regex_pattern;
     regex_pattern.reserve(name_filter.size() * 2);
 
-    for (char ch : name_filter) {
+    // The filter is searched, not matched, so leading and trailing '*' add
+    // nothing but backtracking; runs of '*' collapse into a single ".*".
+    const size_t first = name_filter.find_first_not_of('*');
+    const size_t last = name_filter.find_last_not_of('*');
+    const std::string trimmed =
+        first == std::string::npos ? std::string() : name_filter.substr(first, last - first + 1);
+
+    for (size_t i = 0; i < trimmed.size(); ++i) {
+        const char ch = trimmed[i];
         switch (ch) {
             case '*':
-                regex_pattern += ".*";
+                if (trimmed[i - 1] != '*') {
+                    regex_pattern += ".*";
+                }
                 break;
             case '\\':
             case '^':
@@ -108,6 +120,24 @@ static httplib::Client make_client(const std::string& host, int port, const std:
     return cli;
 }
 
+// Keep-alive clients for make_request(), so repeated calls (bench runs, status
+// polls) reuse one connection instead of reconnecting each time. They are
+// per thread because httplib::Client must not be shared between threads, and
+// `lemonade bench --concurrency` issues requests from several workers.
+static httplib::Client& pooled_client(const std::string& host, int port, const std::string& api_key) {
+    thread_local std::map<std::string, std::unique_ptr<httplib::Client>> clients;
+
+    auto& cli = clients[host + ":" + std::to_string(port) + "|" + api_key];
+    if (!cli) {
+        cli = std::make_unique<httplib::Client>(host, port);
+        cli->set_keep_alive(true);
+        if (api_key != "") {
+            cli->set_bearer_token_auth(api_key);
+        }
+    }
+    return *cli;
+}
+
 static void assert_http_ok(const httplib::Result& res) {
     if (!res) {
         throw std::runtime_error(
@@ -155,7 +185,9 @@ std::string LemonadeClient::make_request(const std::string& path, const std::str
                                           const std::string& body, const std::string& content_type,
                                           time_t connection_timeout_ms, time_t read_timeout_ms) const {
     std::string normalized_host = normalize_host(host_);
-    httplib::Client cli = make_client(normalized_host, port_, api_key_, connection_timeout_ms, read_timeout_ms);
+    httplib::Client& cli = pooled_client(normalized_host, port_, api_key_);
+    cli.set_connection_timeout(connection_timeout_ms / 1000, (connection_timeout_ms % 1000) * 1000);
+    cli.set_read_timeout(read_timeout_ms / 1000, (read_timeout_ms % 1000) * 1000);
 
     httplib::Result res;
 
@@ -495,11 +527,13 @@ int LemonadeClient::list_models(bool show_all, const std::string& name_filter) c
 
         if (!name_filter.empty()) {
             const std::regex filter_regex = build_name_filter_regex(name_filter);
+            // The filter is unanchored, so a match in the bare name (id minus its
+            // "user."/"extra."/"builtin." prefix) is also a match in the full id:
+            // one search per model covers both.
             models.erase(
                 std::remove_if(models.begin(), models.end(),
                     [&](const ModelInfo& m) {
-                        return !std::regex_search(m.id, filter_regex) &&
-                               !std::regex_search(strip_canonical_prefix(m.id), filter_regex);
+                        return !std::regex_search(m.id, filter_regex);
                     }),
                 models.end());
         }
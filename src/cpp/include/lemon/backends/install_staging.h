@@ -24,16 +24,16 @@ namespace lemon::backends {
 #ifdef _WIN32
         const std::string binary_name_exe = binary_name + ".exe";
 #endif
+        // Match the name before asking for the file type: the name comes from the
+        // directory listing, the type may need a stat() per entry.
         for (const fs::directory_entry& dir_entry : fs::recursive_directory_iterator(dir)) {
-            if (dir_entry.is_regular_file()) {
-                const auto& fname = dir_entry.path().filename();
-                if (fname == binary_name
+            const auto fname = dir_entry.path().filename();
+            if ((fname == binary_name
 #ifdef _WIN32
-                    || fname == binary_name_exe
+                 || fname == binary_name_exe
 #endif
-                ) {
-                    return dir_entry.path().string();
-                }
+                ) && dir_entry.is_regular_file()) {
+                return dir_entry.path().string();
             }
         }
         return "";
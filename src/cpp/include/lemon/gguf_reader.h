@@ -9,6 +9,8 @@
 /// the header is read sequentially in one shot.
 
 #include <algorithm>
+#include <cctype>
+#include <cstddef>
 #include <cstdint>
 #include <cstring>
 #include <fstream>
@@ -164,18 +166,29 @@ inline std::string to_lower(const std::string& str) {
     return result;
 }
 
+// The *_ignore_case helpers run once per repo file while resolving variants,
+// so they fold case per character instead of building lowered copies.
+inline bool chars_equal_ignore_case(char a, char b) {
+    return std::tolower(static_cast<unsigned char>(a)) ==
+           std::tolower(static_cast<unsigned char>(b));
+}
+
 inline bool ends_with_ignore_case(const std::string& str, const std::string& suffix) {
     if (suffix.length() > str.length()) return false;
-    return to_lower(str.substr(str.length() - suffix.length())) == to_lower(suffix);
+    return std::equal(suffix.begin(), suffix.end(),
+                      str.end() - static_cast<std::ptrdiff_t>(suffix.length()),
+                      chars_equal_ignore_case);
 }
 
 inline bool starts_with_ignore_case(const std::string& str, const std::string& prefix) {
     if (prefix.length() > str.length()) return false;
-    return to_lower(str.substr(0, prefix.length())) == to_lower(prefix);
+    return std::equal(prefix.begin(), prefix.end(), str.begin(), chars_equal_ignore_case);
 }
 
 inline bool contains_ignore_case(const std::string& str, const std::string& substr) {
-    return to_lower(str).find(to_lower(substr)) != std::string::npos;
+    if (substr.empty()) return true;
+    return std::search(str.begin(), str.end(), substr.begin(), substr.end(),
+                       chars_equal_ignore_case) != str.end();
 }
 
 inline bool has_gguf_magic(const std::string& path) {
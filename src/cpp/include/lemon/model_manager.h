@@ -2,6 +2,7 @@
 
 #include <stdexcept>
 #include <cstdint>
+#include <filesystem>
 #include <string>
 #include <map>
 #include <optional>
@@ -390,6 +391,14 @@ private:
     // stale hard "Model not found" failures for registered user models.
     bool refresh_user_models_from_disk_for_lookup(const std::string& model_name);
 
+    // Last user_models.json parsed by the lookup refresh, with the file's
+    // mtime and size at that read. Repeated misses reuse it until the file changes.
+    std::mutex user_models_lookup_mutex_;
+    json user_models_lookup_snapshot_;
+    std::filesystem::file_time_type user_models_lookup_mtime_{};
+    std::uintmax_t user_models_lookup_size_ = 0;
+    bool user_models_lookup_snapshot_valid_ = false;
+
     void rebuild_public_model_aliases_locked();
 };
 
@@ -52,6 +52,22 @@ inline int compute_tarball_strip_components(const std::string& entries) {
     return (all_same_dir && !first_dir.empty() && has_nested) ? 1 : 0;
 }
 
+// Append one line of extractor output to a diagnostic buffer that is only
+// printed if extraction fails. Output past the cap is dropped (with a single
+// marker) so a corrupt archive that makes the extractor complain about every
+// entry cannot grow the buffer without bound. The caller keeps draining the
+// child's pipe either way.
+inline void append_extract_diagnostic(std::string& output, const std::string& line) {
+    static constexpr size_t MAX_DIAGNOSTIC_BYTES = 4096;
+    if (output.size() >= MAX_DIAGNOSTIC_BYTES) {
+        return;
+    }
+    output += line + "\n";
+    if (output.size() >= MAX_DIAGNOSTIC_BYTES) {
+        output += "... (further output truncated)\n";
+    }
+}
+
 // Abstract interface for platform-specific archive extraction
 class ArchivePlatform {
 public:
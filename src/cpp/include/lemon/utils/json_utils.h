@@ -1,5 +1,6 @@
 #pragma once
 
+#include <fstream>
 #include <string>
 #include <nlohmann/json.hpp>
 
@@ -13,6 +14,9 @@ public:
     // Load JSON from file
     static json load_from_file(const std::string& file_path);
 
+    // Read the rest of an open file in one sized read (open it in binary mode)
+    static std::string read_file_contents(std::ifstream& file);
+
     // Save JSON to file
     static void save_to_file(const json& j, const std::string& file_path);
 
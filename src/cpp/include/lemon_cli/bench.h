@@ -43,6 +43,15 @@ struct BenchRunResult {
     std::string response_text;  // LLM response text (only populated if capture enabled)
 };
 
+// Summary of one metric across runs, computed with a single sort.
+struct BenchMetricStats {
+    double mean = 0.0;
+    double min = 0.0;
+    double max = 0.0;
+    double p50 = 0.0;
+    double p95 = 0.0;
+};
+
 struct BenchScenarioResult {
     std::string scenario_name;
     std::string category;
@@ -59,6 +68,9 @@ struct BenchScenarioResult {
     double tps_max() const;
     double tps_p50() const;
     double tps_p95() const;
+    BenchMetricStats ttft_stats() const;
+    BenchMetricStats tps_stats() const;
+    BenchMetricStats duration_stats() const;
     double vram_peak_gb() const;
     double memory_peak_gb() const;
     int input_tokens() const;    // From first run
@@ -111,17 +123,31 @@ std::vector<BackendDiscovery> discover_backends(lemonade::LemonadeClient& client
                                                 const std::string& model,
                                                 const std::vector<std::string>& requested);
 
+// Same, from already-fetched /system-info and model info responses
+std::vector<BackendDiscovery> discover_backends(const json& sys_info,
+                                                const json& model_info,
+                                                const std::vector<std::string>& requested);
+
 // ============================================================
 // Model Load/Unload
 // ============================================================
 
-// Load model for a specific backend
+// Serialize the /api/v1/load request for a model + backend configuration
+std::string build_load_request_body(const std::string& model,
+                                    const std::string& recipe,
+                                    const std::string& backend,
+                                    int ctx_size,
+                                    const std::string& backend_args);
+
+// Load model for a specific backend.
+// request_body: pre-serialized payload from build_load_request_body(); built on demand if empty.
 bool load_model_for_backend(lemonade::LemonadeClient& client,
                             const std::string& model,
                             const std::string& recipe,
                             const std::string& backend,
                             int ctx_size,
-                            const std::string& backend_args);
+                            const std::string& backend_args,
+                            const std::string& request_body = "");
 
 // Unload all models
 bool unload_all_models(lemonade::LemonadeClient& client);
@@ -130,29 +156,41 @@ bool unload_all_models(lemonade::LemonadeClient& client);
 // Benchmark Execution
 // ============================================================
 
-// Dispatch a single benchmark measurement
+// Serialize the chat-completions (or embeddings) request for a scenario
+std::string build_bench_request_body(const std::string& model, const BenchScenario& scenario);
+
+// Dispatch a single benchmark measurement.
+// request_body: pre-serialized payload from build_bench_request_body(); built on demand if empty.
 BenchRunResult run_single_bench(lemonade::LemonadeClient& client,
                                 const std::string& model,
                                 const BenchScenario& scenario,
                                 bool memory_tracking,
-                                bool capture_response);
+                                bool capture_response,
+                                const std::string& request_body = "");
 
 // Benchmark a single text generation
 BenchRunResult run_single_bench_textgen(lemonade::LemonadeClient& client,
                                 const std::string& model,
                                 const BenchScenario& scenario,
                                 bool memory_tracking,
-                                bool capture_response);
+                                bool capture_response,
+                                const std::string& request_body = "");
 
 // Run a single benchmark measurement with embedding
 BenchRunResult run_single_bench_embed(lemonade::LemonadeClient& client,
                                 const std::string& model,
                                 const BenchScenario& scenario,
                                 bool memory_tracking,
-                                bool capture_response);
+                                bool capture_response,
+                                const std::string& request_body = "");
 
 // Run a full scenario (warmup + measurement runs).
 // When reload=true, unloads+loads the model before each measurement run to clear prompt cache.
+// When reload=false and concurrency > 1, up to `concurrency` measurement requests are in flight at once.
+// request_body: pre-serialized payload from build_bench_request_body(); built on demand if empty.
+// When adaptive_warmup=true, `warmup` is a cap: warmup stops once the relative standard deviation
+// of the last few warmup TTFTs drops below warmup_rsd_threshold. It is only meaningful with
+// reload=false; callers disable it otherwise.
 BenchScenarioResult run_scenario(lemonade::LemonadeClient& client,
                                  const std::string& model,
                                  const BenchScenario& scenario,
@@ -165,7 +203,11 @@ BenchScenarioResult run_scenario(lemonade::LemonadeClient& client,
                                  int ctx_size,
                                  const std::string& backend_args,
                                  const std::string& response_log_path,
-                                 const std::string& response_timestamp = "");
+                                 const std::string& response_timestamp = "",
+                                 int concurrency = 1,
+                                 const std::string& request_body = "",
+                                 bool adaptive_warmup = false,
+                                 double warmup_rsd_threshold = 0.05);
 
 // ============================================================
 // CLI Options (raw values parsed by CLI11 in main.cpp)
@@ -177,6 +219,9 @@ struct BenchCliOptions {
     std::vector<int> ctx_sizes;
     int runs = 3;
     int warmup = 0;
+    int concurrency = 1;
+    bool adaptive_warmup = false;
+    double warmup_rsd_threshold = 0.05;
     std::vector<std::string> scenario_names;
     std::string scenario_file;
     std::string scenario_dir;
@@ -204,6 +249,9 @@ struct BenchConfig {
     std::vector<int> ctx_sizes;
     int warmup_runs = 0;
     int measurement_runs = 3;
+    int concurrency = 1;     // measurement requests kept in flight at once (implies no reload when > 1)
+    bool adaptive_warmup = false;        // warm up until TTFT stabilizes (warmup_runs becomes a cap)
+    double warmup_rsd_threshold = 0.05;  // relative stdev of recent warmup TTFTs that counts as stable
     bool json_output = false;
     std::string output_file;
     std::vector<std::string> scenario_names;
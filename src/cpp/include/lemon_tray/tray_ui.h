@@ -63,9 +63,13 @@ private:
     // Menu
     void build_menu();
     void refresh_menu();
+    // Build and install the menu from already-fetched state, and remember that
+    // state so refresh_menu() can skip rebuilds when nothing changed.
+    void apply_menu(bool reachable,
+                    std::vector<LoadedModelInfo> loaded_models,
+                    std::vector<ModelInfo> available_models);
     Menu create_menu(const std::vector<LoadedModelInfo>& loaded_models,
                      const std::vector<ModelInfo>& available_models);
-    bool menu_needs_refresh();
 
     // Menu actions
     void on_load_model(const std::string& model_name);
@@ -39,6 +39,15 @@ namespace lemon::backends {
         return spec_for(recipe);
     }
 
+    // backend_versions.json ships with the executable and does not change while we
+    // run, so parse it once. A failed load throws out of the static initializer and
+    // is retried on the next call, keeping each caller's error reporting intact.
+    static const json& backend_versions_config() {
+        static const json config = utils::JsonUtils::load_from_file(
+            utils::get_resource_path("resources/backend_versions.json"));
+        return config;
+    }
+
     static std::string hash_string_from_json(const json& node) {
         if (node.is_string()) {
             return node.get<std::string>();
@@ -76,8 +85,7 @@ namespace lemon::backends {
                                                   const std::string& repo,
                                                   const std::string& filename) {
         try {
-            const std::string config_path = utils::get_resource_path("resources/backend_versions.json");
-            const json config = utils::JsonUtils::load_from_file(config_path);
+            const json& config = backend_versions_config();
 
             const std::vector<std::vector<std::string>> candidate_paths = {
                 {"checksums", "github", repo, version, filename},
@@ -266,7 +274,7 @@ namespace lemon::backends {
             platform->get_native_tar_path(),
             {"-xf", archive_path, "-C", dest_dir},
             [&output](const std::string& line) {
-                output += line + "\n";
+                utils::append_extract_diagnostic(output, line);
                 return true;
             },
             "",
@@ -431,9 +439,7 @@ namespace lemon::backends {
             resolved_backend = "rocm-" + channel;
         }
 
-        std::string config_path = utils::get_resource_path("resources/backend_versions.json");
-
-        json config = utils::JsonUtils::load_from_file(config_path);
+        const json& config = backend_versions_config();
 
         if (!config.contains(recipe) || !config[recipe].is_object()) {
             throw std::runtime_error("backend_versions.json is missing '" + recipe + "' section");
@@ -1070,8 +1076,7 @@ namespace lemon::backends {
 
         fs::create_directories(install_dir);
 
-        std::string config_path = utils::get_resource_path("resources/backend_versions.json");
-        json config = utils::JsonUtils::load_from_file(config_path);
+        const json& config = backend_versions_config();
 
         std::string url_variant = arch;
         if (config.contains("therock") && config["therock"].contains("url_mapping") &&
@@ -1195,8 +1200,7 @@ namespace lemon::backends {
 #if !defined(__linux__) && !defined(_WIN32)
         return "";
 #else
-        std::string config_path = utils::get_resource_path("resources/backend_versions.json");
-        json config = utils::JsonUtils::load_from_file(config_path);
+        const json& config = backend_versions_config();
 
         if (!config.contains("therock") || !config["therock"].contains("version")) {
             throw std::runtime_error("backend_versions.json is missing 'therock.version'");
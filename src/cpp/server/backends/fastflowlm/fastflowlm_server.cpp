@@ -248,8 +248,14 @@ bool FastFlowLMServer::wait_for_ready() {
 
     LOG(INFO, "FastFlowLM") << "Waiting for " + server_name_ + " to be ready..." << std::endl;
 
-    const int max_attempts = 300;  // 5 minutes timeout (large models can take time to load)
-    for (int attempt = 0; attempt < max_attempts; ++attempt) {
+    // 5 minutes timeout (large models can take time to load). Poll quickly at
+    // first so a fast start is noticed within tens of milliseconds, then back
+    // off towards once a second for the long loads.
+    const int timeout_seconds = 300;
+    const auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(timeout_seconds);
+    auto poll_interval = std::chrono::milliseconds(50);
+    const auto max_poll_interval = std::chrono::milliseconds(1000);
+    while (std::chrono::steady_clock::now() < deadline) {
         // Check if process is still running. If it already exited, consume and
         // reap the owned handle here so failed-start cleanup cannot later signal
         // a stale PID.
@@ -274,11 +280,12 @@ bool FastFlowLMServer::wait_for_ready() {
             return true;
         }
 
-        std::this_thread::sleep_for(std::chrono::seconds(1));
+        std::this_thread::sleep_for(poll_interval);
+        poll_interval = std::min(poll_interval * 3 / 2, max_poll_interval);
     }
 
     LOG(ERROR, "FastFlowLM") << server_name_ << " failed to start within "
-              << max_attempts << " seconds" << std::endl;
+              << timeout_seconds << " seconds" << std::endl;
     return false;
 }
 
@@ -40,21 +40,24 @@ std::string resolve_gguf_path(const std::string& model_cache_path, const std::st
             return files;
         }
 
+        // Filter on the file name, which the directory listing already carries,
+        // before asking for the file type: HF snapshots are symlinks into blobs/,
+        // so is_regular_file() costs a stat() per entry, and most entries
+        // (README, config, blobs of other files) are rejected by name.
         std::error_code ec;
         for (const auto& entry : fs::recursive_directory_iterator(search_root, hf_cache::dir_options(), ec)) {
             if (ec) break;
+
+            const std::string filename = entry.path().filename().string();
+            if (filename.find(".gguf") == std::string::npos ||
+                to_lower(filename).find("mmproj") != std::string::npos) {
+                continue;
+            }
             if (!entry.is_regular_file(ec)) {
                 ec.clear();
                 continue;
             }
-
-            std::string filename = entry.path().filename().string();
-            std::string filename_lower = filename;
-            std::transform(filename_lower.begin(), filename_lower.end(), filename_lower.begin(), ::tolower);
-
-            if (filename.find(".gguf") != std::string::npos && filename_lower.find("mmproj") == std::string::npos) {
-                files.push_back(path_to_utf8(entry.path()));
-            }
+            files.push_back(path_to_utf8(entry.path()));
         }
         // Sort for consistent ordering (important for sharded models) and so the
         // active/whole-cache sets compare equal when they hold the same files.
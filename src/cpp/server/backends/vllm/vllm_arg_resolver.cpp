@@ -4,6 +4,7 @@
 #include <algorithm>
 #include <cctype>
 #include <map>
+#include <mutex>
 #include <regex>
 #include <set>
 #include <stdexcept>
@@ -184,6 +185,20 @@ const nlohmann::json* find_family(const nlohmann::json& config,
     return &families[family_name];
 }
 
+// Compiled checkpoint_regex patterns, keyed by source text. The config is resolved on
+// every validation and load, so each pattern is compiled once per process. Entries are
+// never erased, so returned references stay valid after the lock is released.
+const std::regex& compiled_checkpoint_regex(const std::string& pattern) {
+    static std::mutex mutex;
+    static std::map<std::string, std::regex> cache;
+    std::lock_guard<std::mutex> lock(mutex);
+    auto it = cache.find(pattern);
+    if (it == cache.end()) {
+        it = cache.emplace(pattern, std::regex(pattern)).first;
+    }
+    return it->second;
+}
+
 const nlohmann::json* match_family_by_checkpoint(const nlohmann::json& config,
                                                  const std::string& checkpoint) {
     if (!config.contains("families") || !config["families"].is_object()) {
@@ -205,7 +220,7 @@ const nlohmann::json* match_family_by_checkpoint(const nlohmann::json& config,
 
             const std::string pattern = matcher["checkpoint_regex"].get<std::string>();
             try {
-                if (std::regex_search(checkpoint, std::regex(pattern))) {
+                if (std::regex_search(checkpoint, compiled_checkpoint_regex(pattern))) {
                     return &family;
                 }
             } catch (const std::regex_error& e) {
@@ -131,6 +131,17 @@ json VLLMServer::prepare_openai_request(const json& request) {
     return JsonUtils::with_legacy_max_tokens_alias(fit_openai_max_tokens_to_context(request));
 }
 
+// Returns quant_method from a snapshot's config.json, or empty string. Opens the
+// file directly: a snapshot without a config just fails to open, so there is
+// no need for a separate exists() stat first.
+static std::string snapshot_quant_method(const fs::path& snapshot) {
+    std::ifstream f(snapshot / "config.json");
+    if (!f.is_open()) return "";
+    std::stringstream buf;
+    buf << f.rdbuf();
+    return parse_quant_method(buf.str());
+}
+
 // Returns quantization_config.quant_method for the model, or empty string.
 // Prefer the Lemonade-managed active snapshot. Hugging Face models retain the
 // historical cache/network fallback; ModelScope models are always loaded from
@@ -139,14 +150,8 @@ static std::string detect_quant_method(const std::string& model_id,
                                        const fs::path& local_snapshot,
                                        RemoteRegistrySource registry_source) {
     if (!local_snapshot.empty()) {
-        fs::path cfg = local_snapshot / "config.json";
-        if (fs::exists(cfg)) {
-            std::ifstream f(cfg);
-            std::stringstream buf;
-            buf << f.rdbuf();
-            std::string result = parse_quant_method(buf.str());
-            if (!result.empty()) return result;
-        }
+        std::string result = snapshot_quant_method(local_snapshot);
+        if (!result.empty()) return result;
     }
 
     if (registry_source != RemoteRegistrySource::HuggingFace) {
@@ -163,17 +168,13 @@ static std::string detect_quant_method(const std::string& model_id,
     const char* home = std::getenv("HOME");
     if (home) {
         fs::path snapshots = fs::path(home) / ".cache" / "huggingface" / "hub" / hf_dir / "snapshots";
-        if (fs::exists(snapshots)) {
-            for (const auto& entry : fs::directory_iterator(snapshots)) {
-                if (!entry.is_directory()) continue;
-                fs::path cfg = entry.path() / "config.json";
-                if (!fs::exists(cfg)) continue;
-                std::ifstream f(cfg);
-                std::stringstream buf;
-                buf << f.rdbuf();
-                std::string result = parse_quant_method(buf.str());
-                if (!result.empty()) return result;
-            }
+        // A missing snapshots dir leaves the iterator at end via ec; entry type
+        // comes from the directory listing itself.
+        std::error_code ec;
+        for (const auto& entry : fs::directory_iterator(snapshots, ec)) {
+            if (!entry.is_directory(ec)) continue;
+            std::string result = snapshot_quant_method(entry.path());
+            if (!result.empty()) return result;
         }
     }
 
@@ -18,10 +18,12 @@
 #include <iostream>
 #include <fstream>
 #include <algorithm>
+#include <atomic>
 #include <cstdlib>
 #include <cstdint>
 #include <cstring>
 #include <sstream>
+#include <string_view>
 #include <thread>
 #include <chrono>
 #include <set>
@@ -29,6 +31,8 @@
 #include <unordered_map>
 #include <unordered_set>
 #include <iomanip>
+#include <map>
+#include <mutex>
 #include <lemon/utils/aixlog.hpp>
 
 #ifndef _WIN32
@@ -53,6 +57,14 @@ static bool safe_is_directory(const fs::path& p) {
     DWORD attrs = GetFileAttributesW(p.c_str());
     return attrs != INVALID_FILE_ATTRIBUTES && (attrs & FILE_ATTRIBUTE_DIRECTORY);
 }
+// Answers safe_exists() and safe_is_directory() with a single attribute
+// lookup for callers that branch on both.
+enum class SafePathKind { Missing, Directory, Other };
+static SafePathKind safe_path_kind(const fs::path& p) {
+    DWORD attrs = GetFileAttributesW(p.c_str());
+    if (attrs == INVALID_FILE_ATTRIBUTES) return SafePathKind::Missing;
+    return (attrs & FILE_ATTRIBUTE_DIRECTORY) ? SafePathKind::Directory : SafePathKind::Other;
+}
 // fs::recursive_directory_iterator also throws on these reparse points.
 // skip_permission_denied tells it to skip inaccessible entries instead of throwing.
 static constexpr auto safe_dir_options = fs::directory_options::skip_permission_denied;
@@ -61,8 +73,9 @@ static constexpr auto safe_dir_options = fs::directory_options::skip_permission_
 // Throws on failure to preserve the fail-fast semantics of fs::create_directories.
 static void ensure_create_directories(const fs::path& p) {
     if (p.empty()) return;
-    if (safe_is_directory(p)) return;
-    if (safe_exists(p)) {
+    const SafePathKind kind = safe_path_kind(p);
+    if (kind == SafePathKind::Directory) return;
+    if (kind == SafePathKind::Other) {
         throw std::runtime_error("Cannot create directory; a non-directory already exists at '" +
                                  path_to_utf8(p) + "'");
     }
@@ -91,10 +104,17 @@ static void ensure_create_directories(const fs::path& p) {
 #else
 static bool safe_exists(const fs::path& p) { return fs::exists(p); }
 static bool safe_is_directory(const fs::path& p) { return fs::is_directory(p); }
+enum class SafePathKind { Missing, Directory, Other };
+static SafePathKind safe_path_kind(const fs::path& p) {
+    const fs::file_status st = fs::status(p);
+    if (!fs::exists(st)) return SafePathKind::Missing;
+    return fs::is_directory(st) ? SafePathKind::Directory : SafePathKind::Other;
+}
 static void ensure_create_directories(const fs::path& p) {
     if (p.empty()) return;
-    if (safe_is_directory(p)) return;
-    if (safe_exists(p)) {
+    const SafePathKind kind = safe_path_kind(p);
+    if (kind == SafePathKind::Directory) return;
+    if (kind == SafePathKind::Other) {
         throw std::runtime_error("Cannot create directory; a non-directory already exists at '" +
                                  path_to_utf8(p) + "'");
     }
@@ -235,26 +255,23 @@ static void write_hf_ref_main(const fs::path& model_cache_path, const std::strin
     }
 }
 
-static std::string checkpoint_to_repo_id(std::string checkpoint) {
-    std::string repo_id = checkpoint;
-
-    size_t colon_pos = checkpoint.find(':');
-    if (colon_pos != std::string::npos) {
-        repo_id = repo_id.substr(0, colon_pos);
-    }
-
-    return repo_id;
+// Checkpoints are "<repo_id>" or "<repo_id>:<variant>". Split on the first
+// colon with a single find(); these run per checkpoint on every cache build
+// and deletion, so avoid the extra by-value copies.
+static std::string_view checkpoint_repo_view(const std::string& checkpoint) {
+    return std::string_view(checkpoint).substr(0, checkpoint.find(':'));
 }
 
-static std::string checkpoint_to_variant(std::string checkpoint) {
-    std::string variant = "";
+static std::string checkpoint_to_repo_id(const std::string& checkpoint) {
+    return std::string(checkpoint_repo_view(checkpoint));
+}
 
+static std::string checkpoint_to_variant(const std::string& checkpoint) {
     size_t colon_pos = checkpoint.find(':');
-    if (colon_pos != std::string::npos) {
-        variant = checkpoint.substr(colon_pos + 1);
+    if (colon_pos == std::string::npos) {
+        return "";
     }
-
-    return variant;
+    return checkpoint.substr(colon_pos + 1);
 }
 
 // Check if any model other than exclude_model references the given repo_id
@@ -269,12 +286,30 @@ static bool is_repo_shared(const std::string& repo_id,
         if (effective_registry_source(info) != normalized_source) continue;
         for (const auto& [type, cp] : info.checkpoints) {
             (void)type;
-            if (checkpoint_to_repo_id(cp) == repo_id) return true;
+            if (checkpoint_repo_view(cp) == repo_id) return true;
         }
     }
     return false;
 }
 
+// Index every repo referenced by a model other than exclude_model, keyed by
+// "<registry_source>:<repo_id>". Callers that need several is_repo_shared()
+// answers for one model build this once instead of rescanning the cache.
+static std::unordered_set<std::string> collect_shared_repos(
+        const std::string& exclude_model,
+        const std::map<std::string, ModelInfo>& cache) {
+    std::unordered_set<std::string> repos;
+    for (const auto& [name, info] : cache) {
+        if (name == exclude_model || !info.source.empty()) continue;
+        const std::string source = effective_registry_source(info);
+        for (const auto& [type, cp] : info.checkpoints) {
+            (void)type;
+            repos.insert(source + ":" + std::string(checkpoint_repo_view(cp)));
+        }
+    }
+    return repos;
+}
+
 // Parse image_defaults from a model JSON entry into ModelInfo
 static void parse_image_defaults(ModelInfo& info, const json& model_json) {
     if (model_json.contains("image_defaults") && model_json["image_defaults"].is_object()) {
@@ -360,6 +395,32 @@ static RecipeOptions build_recipe_options(const ModelInfo& info,
     return RecipeOptions(info.recipe, base_options);
 }
 
+// Blob path -> snapshot symlinks that resolve to it, for one repo cache dir.
+using BlobReferences = std::map<fs::path, std::vector<fs::path>>;
+
+// Walk snapshots/ once and index every symlink by the blob it points at, so
+// deleting a variant with many files doesn't re-walk every snapshot per file.
+static BlobReferences collect_blob_references(const fs::path& models_dir) {
+    BlobReferences refs;
+    std::error_code ec;
+    fs::path snapshots_dir = models_dir / "snapshots";
+    if (!fs::exists(snapshots_dir, ec)) return refs;
+
+    for (auto& entry : fs::recursive_directory_iterator(snapshots_dir, ec)) {
+        if (ec) break;
+        std::error_code entry_ec;
+        if (!entry.is_symlink(entry_ec) || entry_ec) continue;
+
+        fs::path target = fs::read_symlink(entry.path(), entry_ec);
+        if (entry_ec) continue;
+        fs::path blob = fs::canonical(entry.path().parent_path() / target, entry_ec);
+        if (!entry_ec) {
+            refs[blob].push_back(entry.path());
+        }
+    }
+    return refs;
+}
+
 // Clean up orphaned HF cache blobs after deleting a symlink.
 // HF hub downloads use: snapshots/<hash>/file.gguf -> ../../blobs/<sha256>
 // If no remaining symlink in the repo points to the blob, it's safe to remove.
@@ -370,7 +431,7 @@ static RecipeOptions build_recipe_options(const ModelInfo& info,
 // tooling (e.g. hf_hub_download()) to create the blob+symlink layout, since
 // Lemonade's own downloader writes real files without blobs.
 static void cleanup_orphaned_blob(const fs::path& file_path,
-                                  const fs::path& models_dir) {
+                                  const BlobReferences& refs) {
     std::error_code ec;
     if (!fs::is_symlink(file_path, ec) || ec) {
         return;  // Not a symlink (real file) or error — nothing to clean up
@@ -383,20 +444,13 @@ static void cleanup_orphaned_blob(const fs::path& file_path,
     if (ec || !fs::exists(blob_path)) return;
 
     // Check if any other symlink in the repo still references this blob
-    fs::path snapshots_dir = models_dir / "snapshots";
-    if (!fs::exists(snapshots_dir)) return;
-
-    for (auto& entry : fs::recursive_directory_iterator(snapshots_dir, ec)) {
-        if (ec) break;
-        if (entry.path() == file_path) continue;  // Skip the file we're about to delete
-        if (!fs::is_symlink(entry.path(), ec) || ec) continue;
-
-        fs::path other_target = fs::read_symlink(entry.path(), ec);
-        if (ec) continue;
-        fs::path other_blob = fs::canonical(entry.path().parent_path() / other_target, ec);
-        if (!ec && other_blob == blob_path) {
-            // Another symlink still references this blob — keep it
-            return;
+    auto it = refs.find(blob_path);
+    if (it != refs.end()) {
+        for (const auto& referrer : it->second) {
+            if (referrer != file_path) {
+                // Another symlink still references this blob — keep it
+                return;
+            }
         }
     }
 
@@ -439,6 +493,9 @@ static uintmax_t resolved_path_size_bytes(const fs::path& path) {
         return ec ? 0 : size;
     }
 
+    // Query type and size through the directory_entry rather than the path:
+    // the entry caches what the directory enumeration already returned (both
+    // on Windows), so large HF snapshots don't pay an extra stat per file.
     uintmax_t total = 0;
     for (const auto& entry : fs::recursive_directory_iterator(path, safe_dir_options, ec)) {
         if (ec) {
@@ -450,7 +507,7 @@ static uintmax_t resolved_path_size_bytes(const fs::path& path) {
             continue;
         }
 
-        auto size = fs::file_size(entry.path(), ec);
+        auto size = entry.file_size(ec);
         if (!ec) {
             total += size;
         } else {
@@ -516,8 +573,10 @@ static void cleanup_orphaned_blobs_under(const fs::path& path,
         return;
     }
 
+    const BlobReferences refs = collect_blob_references(models_dir);
+
     if (!safe_is_directory(path)) {
-        cleanup_orphaned_blob(path, models_dir);
+        cleanup_orphaned_blob(path, refs);
         return;
     }
 
@@ -527,13 +586,69 @@ static void cleanup_orphaned_blobs_under(const fs::path& path,
             ec.clear();
             break;
         }
-        cleanup_orphaned_blob(entry.path(), models_dir);
+        cleanup_orphaned_blob(entry.path(), refs);
+    }
+}
+
+// fs::remove_all() for model cache trees. Regular files are unlinked from a
+// few worker threads first, overlapping the per-file delete latency that
+// dominates on Windows and network storage for snapshots with hundreds of
+// files. remove_all() then sweeps the emptied directories, symlinks and
+// anything a worker could not remove, so errors surface exactly as before.
+static void remove_tree(const fs::path& root, std::error_code& ec) {
+    // The directory iterator follows a symlinked root, so the parallel pass
+    // would unlink files inside the link's target. Leave anything that is not
+    // a real directory (e.g. a cache dir symlinked to another drive) to
+    // remove_all(), which removes just the link.
+    std::error_code root_ec;
+    if (!fs::is_directory(fs::symlink_status(root, root_ec))) {
+        fs::remove_all(root, ec);
+        return;
+    }
+
+    std::vector<fs::path> files;
+    std::error_code walk_ec;
+    for (fs::recursive_directory_iterator it(root, safe_dir_options, walk_ec), end;
+         !walk_ec && it != end; it.increment(walk_ec)) {
+        std::error_code type_ec;
+        if (!it->is_symlink(type_ec) && it->is_regular_file(type_ec)) {
+            files.push_back(it->path());
+        }
+    }
+
+    if (files.size() > 1) {
+        const size_t worker_count = std::min<size_t>(files.size(), 8);
+        std::atomic<size_t> next_file{0};
+        std::vector<std::thread> workers;
+        workers.reserve(worker_count);
+        for (size_t w = 0; w < worker_count; ++w) {
+            workers.emplace_back([&files, &next_file]() {
+                std::error_code remove_ec;
+                for (size_t i = next_file++; i < files.size(); i = next_file++) {
+                    fs::remove(files[i], remove_ec);
+                }
+            });
+        }
+        for (auto& worker : workers) {
+            worker.join();
+        }
+    }
+
+    fs::remove_all(root, ec);
+}
+
+static void remove_tree(const fs::path& root) {
+    std::error_code ec;
+    remove_tree(root, ec);
+    if (ec) {
+        throw fs::filesystem_error("remove_all", root, ec);
     }
 }
 
 static void remove_resolved_path_or_throw(const fs::path& path,
                                           const std::string& description) {
-    if (!safe_exists(path)) {
+    const SafePathKind kind = safe_path_kind(path);
+    if (kind == SafePathKind::Missing) {
         return;
     }
 
@@ -541,8 +656,8 @@ static void remove_resolved_path_or_throw(const fs::path& path,
                               << path_to_utf8(path) << std::endl;
 
     std::error_code ec;
-    if (safe_is_directory(path)) {
-        fs::remove_all(path, ec);
+    if (kind == SafePathKind::Directory) {
+        remove_tree(path, ec);
     } else {
         fs::remove(path, ec);
     }
@@ -610,7 +725,7 @@ static bool cleanup_incomplete_hf_model_cache(const ModelInfo& info,
         LOG(INFO, "ModelManager") << "Removing incomplete model cache: "
                                   << path_to_utf8(model_cache_path) << std::endl;
         std::error_code ec;
-        fs::remove_all(model_cache_path, ec);
+        remove_tree(model_cache_path, ec);
         if (ec) {
             throw std::runtime_error("Failed to remove incomplete model cache '" +
                                      path_to_utf8(model_cache_path) + "': " + ec.message());
@@ -765,9 +880,10 @@ static GGUFFiles identify_gguf_models(
     }
     else {
         auto vset = lemon::enumerate_gguf_variants(repo_files);
+        const std::string variant_lower = gguf_reader_detail::to_lower(variant);
         std::vector<lemon::GgufVariant> exact_matches;
         for (const auto& v : vset.variants) {
-            if (gguf_reader_detail::to_lower(v.name) == gguf_reader_detail::to_lower(variant)) {
+            if (gguf_reader_detail::to_lower(v.name) == variant_lower) {
                 exact_matches.push_back(v);
             }
         }
@@ -856,6 +972,57 @@ static GGUFFiles identify_gguf_models(
     return result;
 }
 
+static void save_user_json(const std::string& save_path, const json& to_save) {
+    // Ensure directory exists
+    fs::path target = path_from_utf8(save_path);
+    fs::path dir = target.parent_path();
+    ensure_create_directories(dir);
+
+    LOG(INFO, "ModelManager") << "Saving " << target.filename() << std::endl;
+
+    // Write via a unique sibling temp file and then rename into place. Readers
+    // should never observe a truncated or half-written registry, and concurrent
+    // writers should not collide on the same temporary path.
+    std::ostringstream tmp_suffix;
+    tmp_suffix << ".tmp."
+               << std::this_thread::get_id() << "."
+               << std::chrono::steady_clock::now().time_since_epoch().count() << "."
+               << reinterpret_cast<std::uintptr_t>(&to_save);
+    fs::path tmp = target;
+    tmp += tmp_suffix.str();
+    {
+        std::ofstream file(tmp, std::ios::trunc);
+        if (!file.is_open()) {
+            throw std::runtime_error("Failed to open file for writing: " + path_to_utf8(tmp));
+        }
+        try {
+            file << to_save.dump(2);
+            file.flush();
+        } catch (const json::exception& e) {
+            throw std::runtime_error("Failed to write JSON to file " + path_to_utf8(tmp) + ": " + e.what());
+        }
+        if (!file) {
+            throw std::runtime_error("Failed to flush JSON file: " + path_to_utf8(tmp));
+        }
+    }
+
+    std::error_code ec;
+    fs::rename(tmp, target, ec);
+#ifdef _WIN32
+    if (ec) {
+        ec.clear();
+        fs::remove(target, ec);
+        ec.clear();
+        fs::rename(tmp, target, ec);
+    }
+#endif
+    if (ec) {
+        std::error_code cleanup_ec;
+        fs::remove(tmp, cleanup_ec);
+        throw std::runtime_error("Failed to replace JSON file " + save_path + ": " + ec.message());
+    }
+}
+
 ModelManager::ModelManager(const std::string& extra_models_dir)
     : extra_models_dir_(extra_models_dir) {
     server_models_ = load_server_models();
@@ -893,9 +1060,7 @@ ModelManager::ModelManager(const std::string& extra_models_dir)
         if (migrated > 0) {
             recipe_options_ = std::move(migrated_options);
             try {
-                fs::path dir = fs::path(get_recipe_options_file()).parent_path();
-                ensure_create_directories(dir);
-                JsonUtils::save_to_file(recipe_options_, get_recipe_options_file());
+                save_user_json(get_recipe_options_file(), recipe_options_);
                 LOG(INFO, "ModelManager") << "migrated " << migrated
                           << " legacy recipe_options keys to builtin. prefix" << std::endl;
             } catch (const std::exception& e) {
@@ -943,7 +1108,27 @@ bool ModelManager::refresh_user_models_from_disk_for_lookup(const std::string& m
         return false;
     }
 
-    json latest_user_models = load_optional_json(get_user_models_file());
+    // Misses repeat (clients polling a model that was never registered), so
+    // only re-read and re-parse the file when its mtime or size has moved.
+    json latest_user_models;
+    {
+        std::lock_guard<std::mutex> lock(user_models_lookup_mutex_);
+        const std::string user_models_file = get_user_models_file();
+        const fs::path fs_path = path_from_utf8(user_models_file);
+        std::error_code mtime_ec;
+        std::error_code size_ec;
+        const auto mtime = fs::last_write_time(fs_path, mtime_ec);
+        const auto size = fs::file_size(fs_path, size_ec);
+        const bool stat_ok = !mtime_ec && !size_ec;
+        if (!user_models_lookup_snapshot_valid_ || !stat_ok ||
+            mtime != user_models_lookup_mtime_ || size != user_models_lookup_size_) {
+            user_models_lookup_snapshot_ = load_optional_json(user_models_file);
+            user_models_lookup_mtime_ = mtime;
+            user_models_lookup_size_ = size;
+            user_models_lookup_snapshot_valid_ = stat_ok;
+        }
+        latest_user_models = user_models_lookup_snapshot_;
+    }
     if (!latest_user_models.is_object()) {
         return false;
     }
@@ -1200,15 +1385,25 @@ json ModelManager::load_server_models() {
 }
 
 json ModelManager::load_optional_json(const std::string& path) {
-    if (!fs::exists(path)) {
+    // Open directly instead of checking existence first: user_models.json is
+    // re-read on every registration/delete, and exists()+open() is two
+    // syscalls and a race with concurrent writers. Only a failed open pays
+    // for the existence check, to tell "missing" apart from "unreadable".
+    const fs::path fs_path = path_from_utf8(path);
+    std::ifstream file(fs_path, std::ios::binary);
+    if (!file.is_open()) {
+        std::error_code ec;
+        if (fs::exists(fs_path, ec)) {
+            LOG(WARNING, "ModelManager") << "Could not load " << fs_path.filename() << ": failed to open file" << std::endl;
+        }
         return json::object();
     }
 
     try {
-        LOG(INFO, "ModelManager") << "Loading " << fs::path(path).filename() << std::endl;
-        return JsonUtils::load_from_file(path);
+        LOG(INFO, "ModelManager") << "Loading " << fs_path.filename() << std::endl;
+        return json::parse(JsonUtils::read_file_contents(file));
     } catch (const std::exception& e) {
-        LOG(WARNING, "ModelManager") << "Could not load " << fs::path(path).filename() << ": " << e.what() << std::endl;
+        LOG(WARNING, "ModelManager") << "Could not load " << fs_path.filename() << ": " << e.what() << std::endl;
         return json::object();
     }
 }
@@ -1234,57 +1429,6 @@ json ModelManager::get_architecture_defaults(const std::string& architecture) co
     return json::object();
 }
 
-static void save_user_json(const std::string& save_path, const json& to_save) {
-    // Ensure directory exists
-    fs::path target = path_from_utf8(save_path);
-    fs::path dir = target.parent_path();
-    ensure_create_directories(dir);
-
-    LOG(INFO, "ModelManager") << "Saving " << target.filename() << std::endl;
-
-    // Write via a unique sibling temp file and then rename into place. Readers
-    // should never observe a truncated or half-written registry, and concurrent
-    // writers should not collide on the same temporary path.
-    std::ostringstream tmp_suffix;
-    tmp_suffix << ".tmp."
-               << std::this_thread::get_id() << "."
-               << std::chrono::steady_clock::now().time_since_epoch().count() << "."
-               << reinterpret_cast<std::uintptr_t>(&to_save);
-    fs::path tmp = target;
-    tmp += tmp_suffix.str();
-    {
-        std::ofstream file(tmp, std::ios::trunc);
-        if (!file.is_open()) {
-            throw std::runtime_error("Failed to open file for writing: " + path_to_utf8(tmp));
-        }
-        try {
-            file << to_save.dump(2);
-            file.flush();
-        } catch (const json::exception& e) {
-            throw std::runtime_error("Failed to write JSON to file " + path_to_utf8(tmp) + ": " + e.what());
-        }
-        if (!file) {
-            throw std::runtime_error("Failed to flush JSON file: " + path_to_utf8(tmp));
-        }
-    }
-
-    std::error_code ec;
-    fs::rename(tmp, target, ec);
-#ifdef _WIN32
-    if (ec) {
-        ec.clear();
-        fs::remove(target, ec);
-        ec.clear();
-        fs::rename(tmp, target, ec);
-    }
-#endif
-    if (ec) {
-        std::error_code cleanup_ec;
-        fs::remove(tmp, cleanup_ec);
-        throw std::runtime_error("Failed to replace JSON file " + save_path + ": " + ec.message());
-    }
-}
-
 void ModelManager::save_user_models(const json& user_models) {
     save_user_json(get_user_models_file(), user_models);
 }
@@ -1332,6 +1476,8 @@ std::vector<std::string> ModelManager::check_for_model_updates() {
     };
 
     std::unordered_map<std::string, RepoEntry> repos;
+    // Resolved once for every repo below; it re-reads the HF_* environment.
+    const fs::path hf_cache_root = path_from_utf8(get_hf_cache_dir());
 
     {
         std::lock_guard<std::mutex> lock(models_cache_mutex_);
@@ -1376,8 +1522,7 @@ std::vector<std::string> ModelManager::check_for_model_updates() {
 
             if (entry.cached_snapshot.empty()) {
                 const fs::path cache_path =
-                    path_from_utf8(get_hf_cache_dir()) /
-                    repo_id_to_cache_dir_name(repo_id, source);
+                    hf_cache_root / repo_id_to_cache_dir_name(repo_id, source);
 
                 entry.cached_snapshot = read_hf_ref_main(cache_path);
             }
@@ -1611,12 +1756,15 @@ static bool check_component_downloaded(const ModelInfo& info,
     return true;
 }
 
-static bool has_partial_files(const fs::path& dir) {
+// Single non-recursive listing of a checkpoint directory that looks for both
+// interrupted-download markers at once: the .download_manifest.json written
+// while a multi-file download is in flight, and any .partial files.
+static bool has_incomplete_download_markers(const fs::path& dir) {
     std::error_code ec;
-    if (!safe_is_directory(dir)) return false;
-    // Non-recursive scan for .partial markers to confirm folder integrity
     for (const auto& entry : fs::directory_iterator(dir, ec)) {
-        if (entry.path().extension() == ".partial") {
+        const fs::path& entry_path = entry.path();
+        if (entry_path.extension() == ".partial" ||
+            entry_path.filename() == ".download_manifest.json") {
             return true;
         }
     }
@@ -1627,20 +1775,19 @@ static bool is_checkpoint_path_complete(const std::string& path_str) {
     if (path_str.empty()) return false;
 
     fs::path resolved = path_from_utf8(path_str);
-    if (!safe_exists(resolved)) return false;
+    const SafePathKind kind = safe_path_kind(resolved);
+    if (kind == SafePathKind::Missing) return false;
 
     // A manifest or .partial file indicates an interrupted multi-file download.
     // Preserve the existing semantics: file checkpoints check their parent
     // directory for the manifest and their own .partial marker; directory
-    // checkpoints check the directory itself.
-    fs::path marker_dir = safe_is_directory(resolved) ? resolved : resolved.parent_path();
-    if (safe_exists(marker_dir / ".download_manifest.json")) return false;
-
-    if (!safe_is_directory(resolved)) {
-        return !safe_exists(path_from_utf8(path_str + ".partial"));
+    // checkpoints check the directory itself, in one listing pass.
+    if (kind == SafePathKind::Directory) {
+        return !has_incomplete_download_markers(resolved);
     }
 
-    return !has_partial_files(resolved);
+    if (safe_exists(resolved.parent_path() / ".download_manifest.json")) return false;
+    return !safe_exists(path_from_utf8(path_str + ".partial"));
 }
 
 /**
@@ -1883,17 +2030,50 @@ void ModelManager::build_cache() {
     status_ctx.model_manager = this;
 
     int downloaded_count = 0;
-    // First pass: determine download status for non-collection models
+    // First pass: determine download status for non-collection models.
+    // Collections are handled in the second pass after components are resolved.
+    std::vector<ModelInfo*> to_check;
     for (auto& [name, info] : all_models) {
         if (is_model_collection_recipe(info.recipe)) {
-            continue;  // Handled in second pass after components are resolved
+            continue;
         }
         const auto* desc = backends::descriptor_for(info.recipe);
         if (!(desc && desc->dynamic_models)) {
-            info.downloaded = backends::ops_for(info.recipe)->is_downloaded(info, status_ctx);
+            to_check.push_back(&info);
         }
+    }
 
-        if (info.downloaded) {
+    // Each check only reads that model's files in the registry cache, so the
+    // checks are independent. Like sizing below, spread them over a few workers
+    // so slow (network or Windows) storage is not walked one model at a time.
+    unsigned int hw = std::thread::hardware_concurrency();
+    const size_t max_workers = std::clamp<size_t>(static_cast<size_t>(hw) * 2, 4, 16);
+    {
+        size_t worker_count = std::min<size_t>(to_check.size(), max_workers);
+        std::atomic<size_t> next_to_check{0};
+        std::vector<std::thread> check_workers;
+        check_workers.reserve(worker_count);
+        for (size_t w = 0; w < worker_count; ++w) {
+            check_workers.emplace_back([&to_check, &next_to_check, &status_ctx]() {
+                for (size_t i = next_to_check++; i < to_check.size(); i = next_to_check++) {
+                    ModelInfo& info = *to_check[i];
+                    try {
+                        info.downloaded = backends::ops_for(info.recipe)->is_downloaded(info, status_ctx);
+                    } catch (const std::exception& e) {
+                        info.downloaded = false;
+                        LOG(WARNING, "ModelManager") << "Failed to check download status of '"
+                                                     << info.model_name << "': " << e.what() << std::endl;
+                    }
+                }
+            });
+        }
+        for (auto& worker : check_workers) {
+            worker.join();
+        }
+    }
+
+    for (const auto& [name, info] : all_models) {
+        if (!is_model_collection_recipe(info.recipe) && info.downloaded) {
             downloaded_count++;
         }
     }
@@ -1908,11 +2088,38 @@ void ModelManager::build_cache() {
         }
     }
 
+    std::vector<ModelInfo*> to_size;
     for (auto& [name, info] : all_models) {
         populate_model_metadata(info);
         if (info.downloaded) {
-            refresh_on_disk_size(info);
-        }
+            to_size.push_back(&info);
+        }
+    }
+
+    // Sizing walks each downloaded model's files on disk. The models are
+    // independent and the work is dominated by filesystem latency, so fan it
+    // out over a few workers instead of scanning hundreds of trees serially.
+    size_t worker_count = std::min<size_t>(to_size.size(), max_workers);
+    std::atomic<size_t> next_to_size{0};
+    std::vector<std::thread> size_workers;
+    size_workers.reserve(worker_count);
+    for (size_t w = 0; w < worker_count; ++w) {
+        size_workers.emplace_back([&to_size, &next_to_size]() {
+            for (size_t i = next_to_size++; i < to_size.size(); i = next_to_size++) {
+                try {
+                    refresh_on_disk_size(*to_size[i]);
+                } catch (const std::exception& e) {
+                    LOG(WARNING, "ModelManager") << "Failed to size '" << to_size[i]->model_name
+                                                 << "' on disk: " << e.what() << std::endl;
+                }
+            }
+        });
+    }
+    for (auto& worker : size_workers) {
+        worker.join();
+    }
+
+    for (auto& [name, info] : all_models) {
         models_cache_[name] = info;
     }
 
@@ -2230,10 +2437,9 @@ double get_max_memory_of_device(json device, MemoryAllocBehavior mem_alloc_behav
 
 bool parse_TF_env_var(const char* env_var_name) {
     const char* env = std::getenv(env_var_name);
-    return env && (std::string(env) == "1" ||
-                   std::string(env) == "true" ||
-                   std::string(env) == "TRUE" ||
-                   std::string(env) == "yes");
+    if (!env) return false;
+    const std::string value(env);
+    return value == "1" || value == "true" || value == "TRUE" || value == "yes";
 }
 
 std::map<std::string, ModelInfo> ModelManager::filter_models_by_backend(
@@ -2344,6 +2550,7 @@ std::map<std::string, ModelInfo> ModelManager::filter_models_by_backend(
         debug_printed = true;
     }
 
+    std::map<std::string, std::string> recipe_support;  // recipe -> unsupported reason ("" if supported)
     for (const auto& [name, info] : models) {
         const std::string& recipe = info.recipe;
         bool filter_out = false;
@@ -2370,8 +2577,14 @@ std::map<std::string, ModelInfo> ModelManager::filter_models_by_backend(
                                            is_extra_model_name(name) ||
                                            info.source == "local_upload";
 
-        // Check recipe support using the centralized system_info recipes structure
-        std::string unsupported_reason = SystemInfo::check_recipe_supported(recipe);
+        // Check recipe support using the centralized system_info recipes structure.
+        // Each check copies the cached system-info JSON, and hundreds of models
+        // share a handful of recipes, so ask once per recipe.
+        auto support_it = recipe_support.find(recipe);
+        if (support_it == recipe_support.end()) {
+            support_it = recipe_support.emplace(recipe, SystemInfo::check_recipe_supported(recipe)).first;
+        }
+        const std::string& unsupported_reason = support_it->second;
         if (!unsupported_reason.empty()) {
             filter_out = true;
             filter_reason = unsupported_reason + " "
@@ -4227,15 +4440,21 @@ void ModelManager::delete_model(const std::string& model_name) {
 
     fs::path model_cache_path_fs = path_from_utf8(model_cache_path);
     std::string main_repo = checkpoint_to_repo_id(info.checkpoint("main"));
+    // Normalized once here; every shared-repo check and cache-dir name below
+    // reuses it instead of re-parsing the model's registry source.
+    const std::string registry_source = effective_registry_source(info);
+    // One pass over the registry answers the shared-repo question for the
+    // main repo and every non-main checkpoint repo.
+    const auto shared_repos = collect_shared_repos(canonical_model_name, models_cache_);
 
     // Check if the main repo is shared with another model
-    bool main_shared = is_repo_shared(main_repo, effective_registry_source(info), canonical_model_name, models_cache_);
+    bool main_shared = shared_repos.count(registry_source + ":" + main_repo) != 0;
 
     if (!main_shared) {
         // No other model uses this repo — safe to delete the entire directory
         if (fs::exists(model_cache_path_fs)) {
             LOG(INFO, "ModelManager") << "Removing directory..." << std::endl;
-            fs::remove_all(model_cache_path_fs);
+            remove_tree(model_cache_path_fs);
             LOG(INFO, "ModelManager") << "✓ Deleted model files: " << canonical_model_name << std::endl;
         } else {
             LOG(INFO, "ModelManager") << "Warning: Model cache directory not found (may already be deleted)" << std::endl;
@@ -4260,24 +4479,25 @@ void ModelManager::delete_model(const std::string& model_name) {
 
     // Clean up non-main checkpoint files in their own repo dirs (multi-repo models)
     // Only delete if no other model in the registry references the same repo
+    const std::string hf_cache = get_hf_cache_dir();
     for (const auto& [type, checkpoint] : info.checkpoints) {
         if (type == "main" || type == "npu_cache") continue;
 
         std::string cp_repo = checkpoint_to_repo_id(checkpoint);
         if (cp_repo.empty() || cp_repo == main_repo) continue;
 
-        if (is_repo_shared(cp_repo, effective_registry_source(info), canonical_model_name, models_cache_)) {
+        if (shared_repos.count(registry_source + ":" + cp_repo)) {
             LOG(INFO, "ModelManager") << "Keeping shared repo " << cp_repo
                         << " (used by other models)" << std::endl;
             continue;
         }
 
         // Not shared — safe to delete the entire repo directory
-        std::string cp_cache_dir = get_hf_cache_dir() + "/" + repo_id_to_cache_dir_name(cp_repo, effective_registry_source(info));
+        std::string cp_cache_dir = hf_cache + "/" + repo_id_to_cache_dir_name(cp_repo, registry_source);
         fs::path cp_cache_path = path_from_utf8(cp_cache_dir);
         if (fs::exists(cp_cache_path)) {
             LOG(INFO, "ModelManager") << "Removing non-main repo directory: " << cp_cache_dir << std::endl;
-            fs::remove_all(cp_cache_path);
+            remove_tree(cp_cache_path);
         }
     }
 
@@ -4308,6 +4528,14 @@ json ModelManager::cleanup_orphaned_cache(bool dry_run) {
 
     std::lock_guard<std::mutex> lock(models_cache_mutex_);
 
+    // A non-main checkpoint whose file may have been left in the main repo dir
+    struct OrphanCandidate {
+        std::string type;
+        std::string cp_repo;
+        std::string variant;
+        bool found = false;
+    };
+
     // Find multi-repo models where non-main checkpoints reference different repos
     for (const auto& [name, info] : models_cache_) {
         if (info.checkpoints.size() <= 1) continue;
@@ -4315,6 +4543,7 @@ json ModelManager::cleanup_orphaned_cache(bool dry_run) {
         std::string main_repo = checkpoint_to_repo_id(info.checkpoint("main"));
         std::string main_cache = hf_cache + "/" + repo_id_to_cache_dir_name(main_repo, effective_registry_source(info));
 
+        std::vector<OrphanCandidate> candidates;
         for (const auto& [type, checkpoint] : info.checkpoints) {
             if (type == "main" || type == "npu_cache") continue;
 
@@ -4324,41 +4553,53 @@ json ModelManager::cleanup_orphaned_cache(bool dry_run) {
             std::string variant = checkpoint_to_variant(checkpoint);
             if (variant.empty()) continue;
 
-            // Check if file exists in main repo dir (orphaned location)
-            fs::path main_cache_fs = path_from_utf8(main_cache);
-            if (!fs::exists(main_cache_fs)) continue;
-
-            // Search for the variant file in the main repo's cache
-            for (const auto& entry : fs::recursive_directory_iterator(main_cache_fs)) {
-                if (!entry.is_regular_file()) continue;
+            candidates.push_back({type, cp_repo, variant});
+        }
+        if (candidates.empty()) continue;
 
-                std::string filename = entry.path().filename().string();
-                // Match by filename for simple variants, or by path suffix for nested variants
-                bool matches = (filename == variant) ||
-                    (variant.find('/') != std::string::npos &&
-                     path_to_utf8(entry.path()).find(variant) != std::string::npos);
+        // Check if file exists in main repo dir (orphaned location)
+        fs::path main_cache_fs = path_from_utf8(main_cache);
+        if (!fs::exists(main_cache_fs)) continue;
 
-                if (matches) {
-                    size_t file_size = fs::file_size(entry.path());
-                    std::string file_path = path_to_utf8(entry.path());
+        // Search the main repo's cache once for all of this model's candidates,
+        // stopping as soon as each has been found, rather than re-walking the
+        // tree per checkpoint.
+        std::vector<fs::path> matches;
+        for (const auto& entry : fs::recursive_directory_iterator(main_cache_fs)) {
+            if (matches.size() == candidates.size()) break;
+            if (!entry.is_regular_file()) continue;
 
+            std::string filename = entry.path().filename().string();
+            for (auto& candidate : candidates) {
+                if (candidate.found) continue;
+                // Match by filename for simple variants, or by path suffix for nested variants
+                bool matches_variant = (filename == candidate.variant) ||
+                    (candidate.variant.find('/') != std::string::npos &&
+                     path_to_utf8(entry.path()).find(candidate.variant) != std::string::npos);
+                if (matches_variant) {
+                    candidate.found = true;  // Found the orphan for this checkpoint
+                    matches.push_back(entry.path());
+
+                    size_t file_size = entry.file_size();
                     orphaned_files.push_back({
-                        {"path", file_path},
+                        {"path", path_to_utf8(entry.path())},
                         {"size", file_size},
                         {"model", name},
-                        {"type", type},
-                        {"belongs_to", cp_repo}
+                        {"type", candidate.type},
+                        {"belongs_to", candidate.cp_repo}
                     });
                     total_bytes += file_size;
-
-                    if (!dry_run) {
-                        LOG(INFO, "ModelManager") << "Removing orphaned file: " << file_path << std::endl;
-                        fs::remove(entry.path());
-                    }
-                    break;  // Found the orphan for this checkpoint
+                    break;
                 }
             }
         }
+
+        if (!dry_run) {
+            for (const auto& path : matches) {
+                LOG(INFO, "ModelManager") << "Removing orphaned file: " << path_to_utf8(path) << std::endl;
+                fs::remove(path);
+            }
+        }
     }
 
     json result;
@@ -762,11 +762,18 @@ std::string registry_tree_snapshot_id(RemoteRegistrySource source,
 
 std::string registry_repo_cache_dir_name(const std::string& repo_id,
                                          RemoteRegistrySource source) {
+    // Called for every checkpoint on each cache build, so append in place
+    // rather than materializing a temporary string per character.
     std::string cache_dir_name = source == RemoteRegistrySource::ModelScope
         ? "modelscope--models--"
         : "models--";
+    cache_dir_name.reserve(cache_dir_name.size() + repo_id.size() + 4);
     for (char c : repo_id) {
-        cache_dir_name += (c == '/') ? "--" : std::string(1, c);
+        if (c == '/') {
+            cache_dir_name += "--";
+        } else {
+            cache_dir_name += c;
+        }
     }
     return cache_dir_name;
 }
@@ -5,6 +5,7 @@
 #include <cstring>
 #include <vector>
 #include <cmath>
+#include <mutex>
 #include <fcntl.h>
 #include <unistd.h>
 #include <sys/ioctl.h>
@@ -15,6 +16,11 @@ namespace fs = std::filesystem;
 
 namespace lemon {
 
+// DRM card directories are "cardN"; connector entries ("card0-DP-1") are skipped.
+static bool is_drm_card_name(const std::string& name) {
+    return name.compare(0, 4, "card") == 0 && name.find('-') == std::string::npos;
+}
+
 class LinuxMetricsPlatform : public SystemMetricsPlatform {
 public:
     const char* get_platform_name() const override {
@@ -87,22 +93,10 @@ public:
 
     double get_gpu_usage() override {
         try {
-            std::string drm_path = "/sys/class/drm";
-
-            if (!fs::exists(drm_path)) {
-                return -1.0;
-            }
-
             double highest_usage = -1.0;
 
-            for (const auto& entry : fs::directory_iterator(drm_path)) {
-                std::string card_name = entry.path().filename().string();
-                if (card_name.find("card") != 0 || card_name.find("-") != std::string::npos) {
-                    continue;
-                }
-
-                std::string busy_path = entry.path().string() + "/device/gpu_busy_percent";
-                std::ifstream busy_file(busy_path);
+            for (const auto& device_path : drm_card_devices()) {
+                std::ifstream busy_file(device_path + "/gpu_busy_percent");
                 if (busy_file.is_open()) {
                     double usage;
                     busy_file >> usage;
@@ -110,6 +104,8 @@ public:
                     if (usage > highest_usage) {
                         highest_usage = usage;
                     }
+                } else {
+                    check_drm_card_present(device_path);
                 }
             }
 
@@ -121,34 +117,25 @@ public:
 
     double get_vram_usage_gb() override {
         try {
-            std::string drm_path = "/sys/class/drm";
-
-            if (!fs::exists(drm_path)) {
-                return -1.0;
-            }
-
             double highest_usage = -1.0;
-            std::string highest_card;
             double highest_card_memory = 0.0;
 
-            for (const auto& entry : fs::directory_iterator(drm_path)) {
-                std::string card_name = entry.path().filename().string();
-                if (card_name.find("card") != 0 || card_name.find("-") != std::string::npos) {
-                    continue;
-                }
-
-                std::string device_path = entry.path().string() + "/device";
-
+            for (const auto& device_path : drm_card_devices()) {
                 // Read GPU utilization to find the most active GPU
                 double gpu_usage = 0.0;
                 std::ifstream busy_file(device_path + "/gpu_busy_percent");
                 if (busy_file.is_open()) {
                     busy_file >> gpu_usage;
                     busy_file.close();
+                } else {
+                    check_drm_card_present(device_path);
                 }
 
-                // Check if this is a dGPU (has board_info) or APU (no board_info)
-                bool is_dgpu = fs::exists(device_path + "/board_info");
+                // Only the busiest GPU with memory info is reported, so skip
+                // the memory reads for cards that cannot beat the current one.
+                if (!(gpu_usage > highest_usage || highest_usage < 0)) {
+                    continue;
+                }
 
                 // Read VRAM used
                 uint64_t vram_used = 0;
@@ -171,15 +158,15 @@ public:
                     continue;
                 }
 
+                // Check if this is a dGPU (has board_info) or APU (no board_info)
+                bool is_dgpu = fs::exists(device_path + "/board_info");
+
                 // Calculate memory for this card
                 uint64_t card_memory = is_dgpu ? vram_used : (vram_used + gtt_used);
 
                 // Track the GPU with highest utilization
-                if (gpu_usage > highest_usage || highest_usage < 0) {
-                    highest_usage = gpu_usage;
-                    highest_card = card_name;
-                    highest_card_memory = card_memory / (1024.0 * 1024.0 * 1024.0); // Convert to GB
-                }
+                highest_usage = gpu_usage;
+                highest_card_memory = card_memory / (1024.0 * 1024.0 * 1024.0); // Convert to GB
             }
 
             return highest_card_memory > 0 ? highest_card_memory : -1.0;
@@ -263,6 +250,40 @@ public:
             return -1.0;
         }
     }
+
+private:
+    // Device dirs of the /sys/class/drm cards, found once instead of listing
+    // the directory on every metrics sample. GPUs do not come and go during a
+    // session; if none were found yet or a cached card disappears, the list
+    // is rebuilt on the next sample.
+    std::mutex drm_cards_mutex_;
+    std::vector<std::string> drm_card_devices_;
+    bool drm_cards_scanned_ = false;
+
+    std::vector<std::string> drm_card_devices() {
+        std::lock_guard<std::mutex> lock(drm_cards_mutex_);
+        if (!drm_cards_scanned_ || drm_card_devices_.empty()) {
+            drm_card_devices_.clear();
+            std::error_code ec;
+            for (const auto& entry : fs::directory_iterator("/sys/class/drm", ec)) {
+                if (is_drm_card_name(entry.path().filename().string())) {
+                    drm_card_devices_.push_back(entry.path().string() + "/device");
+                }
+            }
+            drm_cards_scanned_ = true;
+        }
+        return drm_card_devices_;
+    }
+
+    // Called when a cached card's sysfs file could not be opened: rescan on the
+    // next sample if the card itself is gone (e.g. a detached eGPU).
+    void check_drm_card_present(const std::string& device_path) {
+        std::error_code ec;
+        if (!fs::exists(device_path, ec)) {
+            std::lock_guard<std::mutex> lock(drm_cards_mutex_);
+            drm_cards_scanned_ = false;
+        }
+    }
 };
 
 std::unique_ptr<SystemMetricsPlatform> create_metrics_platform() {
@@ -184,9 +184,11 @@ RuntimeConfig::RuntimeConfig(const json& config)
 
     // In CI mode, override log level to debug for easier diagnostics
     const char* ci_mode = std::getenv("LEMONADE_CI_MODE");
-    if (ci_mode && (std::string(ci_mode) == "1" || std::string(ci_mode) == "true" ||
-                    std::string(ci_mode) == "True" || std::string(ci_mode) == "TRUE")) {
-        config_["log_level"] = "debug";
+    if (ci_mode) {
+        const std::string value(ci_mode);
+        if (value == "1" || value == "true" || value == "True" || value == "TRUE") {
+            config_["log_level"] = "debug";
+        }
     }
 }
 
@@ -39,6 +39,7 @@
 #include <filesystem>
 #include <system_error>
 #include <algorithm>
+#include <string_view>
 #include <cmath>
 #include <set>
 #include <vector>
@@ -1003,21 +1004,52 @@ void Server::setup_static_files(httplib::Server &web_server) {
     // Determine static files directory (relative to executable)
     std::string static_dir = utils::get_resource_path("resources/static");
 
-    // Create a reusable handler for serving index.html with template variable replacement
-    auto serve_index_html = [this, static_dir](const httplib::Request&, httplib::Response& res) {
-        std::string index_path = static_dir + "/index.html";
-        std::ifstream file(index_path);
+    // The status page embeds the filtered model list, so it only changes when
+    // that list does. Keep the last rendered page and reuse it while the
+    // embedded models snippet is unchanged, skipping the template read and
+    // substitution on repeat loads.
+    struct RenderedIndex {
+        std::mutex mutex;
+        std::string server_models_js;
+        std::string html;
+    };
+    auto rendered_index = std::make_shared<RenderedIndex>();
 
-        if (!file.is_open()) {
-            LOG(ERROR, "Server") << "Could not open index.html at: " << index_path << std::endl;
-            res.status = 404;
-            res.set_content("{\"error\": \"index.html not found\"}", "application/json");
-            return;
+    // The template itself never changes while the server runs; read it once.
+    const std::string index_path = static_dir + "/index.html";
+    auto index_template = std::make_shared<std::string>();
+    bool index_found = false;
+    {
+        std::ifstream file(index_path);
+        if (file.is_open()) {
+            index_template->assign(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+            index_found = true;
         }
+    }
+
+    // Get platform name
+    std::string platform_name;
+    #ifdef _WIN32
+        platform_name = "Windows";
+    #elif __APPLE__
+        platform_name = "Darwin";
+    #elif __linux__
+        platform_name = "Linux";
+    #else
+        platform_name = "Unknown";
+    #endif
+    const std::string platform_js = "<script>window.PLATFORM = '" + platform_name + "';</script>";
 
-        // Read the entire file
-        std::string html_template((std::istreambuf_iterator<char>(file)), std::istreambuf_iterator<char>());
-        file.close();
+    // Create a reusable handler for serving index.html with template variable replacement
+    auto serve_index_html = [this, index_path, index_found, index_template, rendered_index, platform_js](
+            const httplib::Request&, httplib::Response& res) {
+        auto send_html = [&res](const std::string& html) {
+            // Set no-cache headers
+            res.set_header("Cache-Control", "no-cache, no-store, must-revalidate");
+            res.set_header("Pragma", "no-cache");
+            res.set_header("Expires", "0");
+            res.set_content(html, "text/html");
+        };
 
         // Get filtered models from model manager
         auto models_map = model_manager_->get_supported_models();
@@ -1051,42 +1083,65 @@ void Server::setup_static_files(httplib::Server &web_server) {
         // Create JavaScript snippets
         std::string server_models_js = "<script>window.SERVER_MODELS = " + filtered_models.dump() + ";</script>";
 
-        // Get platform name
-        std::string platform_name;
-        #ifdef _WIN32
-            platform_name = "Windows";
-        #elif __APPLE__
-            platform_name = "Darwin";
-        #elif __linux__
-            platform_name = "Linux";
-        #else
-            platform_name = "Unknown";
-        #endif
-        std::string platform_js = "<script>window.PLATFORM = '" + platform_name + "';</script>";
-
-        // Replace template variables
-        size_t pos;
-
-        // Replace {{SERVER_PORT}}
-        while ((pos = html_template.find("{{SERVER_PORT}}")) != std::string::npos) {
-            html_template.replace(pos, 15, std::to_string(port_));
+        {
+            std::lock_guard<std::mutex> lock(rendered_index->mutex);
+            if (!rendered_index->html.empty() && rendered_index->server_models_js == server_models_js) {
+                send_html(rendered_index->html);
+                return;
+            }
         }
 
-        // Replace {{SERVER_MODELS_JS}}
-        while ((pos = html_template.find("{{SERVER_MODELS_JS}}")) != std::string::npos) {
-            html_template.replace(pos, 20, server_models_js);
+        if (!index_found) {
+            LOG(ERROR, "Server") << "Could not open index.html at: " << index_path << std::endl;
+            res.status = 404;
+            res.set_content("{\"error\": \"index.html not found\"}", "application/json");
+            return;
         }
 
-        // Replace {{PLATFORM_JS}}
-        while ((pos = html_template.find("{{PLATFORM_JS}}")) != std::string::npos) {
-            html_template.replace(pos, 15, platform_js);
+        const std::string& html_template = *index_template;
+
+        // Replace template variables in a single pass over the template. Each
+        // find()+replace() loop rescanned from the start and shifted the tail
+        // of the page (which holds the whole model list) on every hit.
+        const std::string port_str = std::to_string(port_);
+        const std::pair<std::string_view, std::string_view> substitutions[] = {
+            {"{{SERVER_PORT}}", port_str},
+            {"{{SERVER_MODELS_JS}}", server_models_js},
+            {"{{PLATFORM_JS}}", platform_js},
+        };
+        std::string html;
+        html.reserve(html_template.size() + server_models_js.size() + platform_js.size());
+        size_t pos = 0;
+        while (pos < html_template.size()) {
+            size_t open = html_template.find("{{", pos);
+            if (open == std::string::npos) {
+                break;
+            }
+            html.append(html_template, pos, open - pos);
+            pos = open;
+            bool substituted = false;
+            for (const auto& [placeholder, value] : substitutions) {
+                if (html_template.compare(open, placeholder.size(), placeholder) == 0) {
+                    html += value;
+                    pos += placeholder.size();
+                    substituted = true;
+                    break;
+                }
+            }
+            if (!substituted) {
+                // Advance one brace only, so a placeholder right after an
+                // extra '{' (e.g. "{{{SERVER_PORT}}") is still matched.
+                html += '{';
+                pos += 1;
+            }
         }
+        html.append(html_template, pos, std::string::npos);
 
-        // Set no-cache headers
-        res.set_header("Cache-Control", "no-cache, no-store, must-revalidate");
-        res.set_header("Pragma", "no-cache");
-        res.set_header("Expires", "0");
-        res.set_content(html_template, "text/html");
+        send_html(html);
+
+        std::lock_guard<std::mutex> lock(rendered_index->mutex);
+        rendered_index->server_models_js = std::move(server_models_js);
+        rendered_index->html = std::move(html);
     };
 
     // Keep status page at /status endpoint
@@ -1106,22 +1161,21 @@ void Server::setup_static_files(httplib::Server &web_server) {
 
     // Check if web app directory exists
     if (fs::exists(web_app_dir) && fs::is_directory(web_app_dir)) {
-        // Create a handler for serving web app index.html for SPA routing
-        auto serve_web_app_html = [web_app_dir](const httplib::Request&, httplib::Response& res) {
-            std::string index_path = web_app_dir + "/index.html";
-            std::ifstream file(index_path);
-
-            if (!file.is_open()) {
-                res.status = 404;
-                res.set_content("{\"error\": \"Web app not found\"}", "application/json");
-                return;
+        // The web app shell is static for the life of the process: read it and
+        // inject the window.api shim once instead of on every SPA navigation.
+        std::string web_app_index_path = web_app_dir + "/index.html";
+        auto web_app_html = std::make_shared<std::string>();
+        bool web_app_found = false;
+        {
+            std::ifstream file(web_app_index_path);
+            if (file.is_open()) {
+                web_app_html->assign(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+                web_app_found = true;
             }
+        }
 
-            std::string html((std::istreambuf_iterator<char>(file)), std::istreambuf_iterator<char>());
-            file.close();
-
-            // Inject mock window.api for web compatibility with the shared Tauri app renderer
-            std::string mock_api = R"(
+        // Inject mock window.api for web compatibility with the shared Tauri app renderer
+        std::string mock_api = R"(
 <script>
 // Mock window.api for web compatibility (the Tauri shim is skipped in pure-web mode)
 window.api = {
@@ -1194,17 +1248,25 @@ window.api = {
 </script>
 )";
 
-            // Insert mock API before the closing </head> tag
-            size_t head_end_pos = html.find("</head>");
-            if (head_end_pos != std::string::npos) {
-                html.insert(head_end_pos, mock_api);
+        // Insert mock API before the closing </head> tag
+        size_t head_end_pos = web_app_html->find("</head>");
+        if (head_end_pos != std::string::npos) {
+            web_app_html->insert(head_end_pos, mock_api);
+        }
+
+        // Create a handler for serving web app index.html for SPA routing
+        auto serve_web_app_html = [web_app_found, web_app_html](const httplib::Request&, httplib::Response& res) {
+            if (!web_app_found) {
+                res.status = 404;
+                res.set_content("{\"error\": \"Web app not found\"}", "application/json");
+                return;
             }
 
             // Set no-cache headers
             res.set_header("Cache-Control", "no-cache, no-store, must-revalidate");
             res.set_header("Pragma", "no-cache");
             res.set_header("Expires", "0");
-            res.set_content(html, "text/html");
+            res.set_content(*web_app_html, "text/html");
         };
 
         // Serve the web app's index.html at root and for SPA routes
@@ -2238,13 +2300,16 @@ nlohmann::json Server::model_info_to_json(const std::string& model_id, const Mod
     // cannot recurse unboundedly.
     if (is_model_collection_recipe(info.recipe) && depth < kMaxCollectionEmbedDepth) {
         nlohmann::json component_models = nlohmann::json::array();
-        for (const auto& component : info.components) {
+        // Reuse the public names resolved above rather than looking each
+        // component up in the model manager a second time.
+        for (size_t i = 0; i < info.components.size(); ++i) {
+            const auto& component = info.components[i];
             if (!model_manager_->model_exists(component)) {
                 continue;
             }
             auto comp_info = model_manager_->get_model_info(component);
             component_models.push_back(model_info_to_json(
-                model_manager_->get_public_model_name(component), comp_info, depth + 1));
+                public_components[i], comp_info, depth + 1));
         }
         model_json["models"] = component_models;
     }
@@ -2596,8 +2661,14 @@ void Server::handle_chat_completions(const httplib::Request& req, httplib::Respo
                         LOG(DEBUG, "Server") << "Response contains tool_calls: " << message["tool_calls"].dump() << std::endl;
                     } else {
                         LOG(DEBUG, "Server") << "Response message does NOT contain tool_calls" << std::endl;
-                        if (message.contains("content")) {
-                            LOG(DEBUG, "Server") << "Message content: " << message["content"].get<std::string>().substr(0, 200) << std::endl;
+                        if (message.contains("content") && message["content"].is_string()) {
+                            // Preview by byte length without copying the full content, cut back
+                            // to a UTF-8 boundary so multibyte text isn't split mid-sequence.
+                            const auto& content = message["content"].get_ref<const std::string&>();
+                            size_t len = std::min<size_t>(200, content.size());
+                            while (len > 0 && len < content.size() &&
+                                   (static_cast<unsigned char>(content[len]) & 0xC0) == 0x80) --len;
+                            LOG(DEBUG, "Server") << "Message content: " << std::string_view(content).substr(0, len) << std::endl;
                         }
                     }
                 }
@@ -23,6 +23,7 @@
 #include <set>
 #include <map>
 #include <mutex>
+#include <optional>
 #include <vector>
 #include <cmath>
 
@@ -761,14 +762,8 @@ static bool is_bin_pinned_to_latest(const std::string& recipe, const std::string
 static std::string get_expected_backend_version(const std::string& recipe, const std::string& backend) {
     static json backend_versions = []() -> json {
         try {
-            std::string config_path = utils::get_resource_path("resources/backend_versions.json");
-            std::ifstream file(config_path);
-            if (!file.is_open()) {
-                return json::object();
-            }
-            json data = json::parse(file);
-            file.close();
-            return data;
+            return JsonUtils::load_from_file(
+                utils::get_resource_path("resources/backend_versions.json"));
         } catch (...) {
             return json::object();
         }
@@ -1492,12 +1487,15 @@ json SystemInfo::build_recipes_info(const json& devices) {
             // than the minimum required.
             const auto* ver_desc = backends::descriptor_for(def.recipe);
             if (ver_desc && ver_desc->version_policy == VersionPolicy::AtLeast) {
-                auto installed_ver = utils::Version::parse(installed_version);
-                auto expected_ver = utils::Version::parse(expected_version);
-                // If either version cannot be parsed, fall back to exact equality check
-                bool version_at_least_expected = (!installed_ver.empty() && !expected_ver.empty())
-                    ? (installed_ver >= expected_ver)
-                    : (installed_version == expected_version);
+                // Identical strings are the common case, so only parse when they differ.
+                // If either version cannot be parsed, exact equality (already false) decides.
+                bool version_at_least_expected = installed_version == expected_version;
+                if (!version_at_least_expected) {
+                    auto installed_ver = utils::Version::parse(installed_version);
+                    auto expected_ver = utils::Version::parse(expected_version);
+                    version_at_least_expected = !installed_ver.empty() && !expected_ver.empty()
+                        && installed_ver >= expected_ver;
+                }
                 needs_update = has_expected && (!version_known || !version_at_least_expected);
             } else
 #endif
@@ -1831,10 +1829,15 @@ std::string identify_rocm_arch_from_name(const std::string& device_name) {
     std::string device_lower = device_name;
     std::transform(device_lower.begin(), device_lower.end(), device_lower.begin(), ::tolower);
 
-    std::smatch gfx_match;
     // Match 3- or 4-digit gfx tokens; the trailing nibble can be hex (e.g. gfx90a).
-    if (std::regex_search(device_lower, gfx_match, std::regex(R"((gfx[0-9a-f]{3,4}))"))) {
-        return gfx_match[1].str();
+    // Most inputs are marketing names or KFD ISA numbers with no "gfx" at all,
+    // so a literal find() gates the regex.
+    if (device_lower.find("gfx") != std::string::npos) {
+        std::smatch gfx_match;
+        static const std::regex gfx_re(R"((gfx[0-9a-f]{3,4}))");
+        if (std::regex_search(device_lower, gfx_match, gfx_re)) {
+            return gfx_match[1].str();
+        }
     }
 
     // Linux will pass the ISA from KFD, transform it to what the rest of lemonade expects
@@ -1861,51 +1864,25 @@ std::string identify_rocm_arch_from_name(const std::string& device_name) {
         return "";
     }
 
-    if (device_lower.find("8050s") != std::string::npos ||
-        device_lower.find("8060s") != std::string::npos ||
-        device_lower.find("device 1586") != std::string::npos) {
-        return "gfx1151";
-    }
-
-    if (device_lower.find("880m") != std::string::npos ||
-        device_lower.find("890m") != std::string::npos) {
-        return "gfx1150";
-    }
-
-    if (device_lower.find("840m") != std::string::npos ||
-        device_lower.find("860m") != std::string::npos) {
-        return "gfx1152";
-    }
-
-    if (device_lower.find("r9700") != std::string::npos ||
-        device_lower.find("9060") != std::string::npos ||
-        device_lower.find("9070") != std::string::npos) {
-        return "gfx120X";
-    }
-
-    // "7600" alone is not product-specific enough: it also matches names like
-    // "AMD Radeon HD 7600M Series" (a GCN1 card from 2012, not RDNA3). Match
-    // the actual product family instead.
-    if (device_lower.find("rx 7600") != std::string::npos ||
-        device_lower.find("rx7600") != std::string::npos ||
-        device_lower.find("pro w7600") != std::string::npos ||
-        device_lower.find("7700") != std::string::npos ||
-        device_lower.find("7800") != std::string::npos ||
-        device_lower.find("7900") != std::string::npos ||
-        device_lower.find("v710") != std::string::npos) {
-        return "gfx110X";
-    }
-
-	// AMD RDNA2 dGPUs (RX 6000 series) → gfx103X
-    if (device_lower.find("6950") != std::string::npos ||
-        device_lower.find("6900") != std::string::npos ||
-        device_lower.find("6800") != std::string::npos ||
-        device_lower.find("6750") != std::string::npos ||
-        device_lower.find("6700") != std::string::npos ||
-        device_lower.find("6650") != std::string::npos ||
-        device_lower.find("6600") != std::string::npos ||
-        device_lower.find("6500") != std::string::npos) {
-        return "gfx103X";
+    // Compact table: {gfx family, {substrings that identify the family}}.
+    // First match wins, mirroring the NVIDIA sm_XX table above.
+    //
+    // "7600" alone is not product-specific enough for gfx110X: it also matches
+    // names like "AMD Radeon HD 7600M Series" (a GCN1 card from 2012, not
+    // RDNA3), so the actual product families are listed instead. gfx103X is
+    // the AMD RDNA2 dGPUs (RX 6000 series).
+    static const std::vector<std::pair<std::string, std::vector<std::string>>> TABLE = {
+        {"gfx1151", {"8050s", "8060s", "device 1586"}},
+        {"gfx1150", {"880m", "890m"}},
+        {"gfx1152", {"840m", "860m"}},
+        {"gfx120X", {"r9700", "9060", "9070"}},
+        {"gfx110X", {"rx 7600", "rx7600", "pro w7600", "7700", "7800", "7900", "v710"}},
+        {"gfx103X", {"6950", "6900", "6800", "6750", "6700", "6650", "6600", "6500"}},
+    };
+    for (const auto& [family, keywords] : TABLE) {
+        for (const auto& kw : keywords) {
+            if (device_lower.find(kw) != std::string::npos) return family;
+        }
     }
 
     return "";
@@ -2059,18 +2036,40 @@ bool needs_gfx1151_cwsr_fix() {
 // This is the single source of truth for NPU family detection
 std::string identify_npu_arch() {
 #ifdef _WIN32
-    wmi::WMIConnection wmi_conn;
-    if (!wmi_conn.is_valid()) {
-        return "";
-    }
+    // Probe once per process: the PCI device list cannot change while we run,
+    // and every device-info request would otherwise repeat the WMI query.
+    // A failed WMI connection is not cached so a later call can retry.
+    static std::mutex probe_mutex;
+    static bool probed = false;
+    static bool found_xdna2 = false;
+    std::lock_guard<std::mutex> lock(probe_mutex);
+    if (!probed) {
+        // XDNA NPUs only ship inside AMD processors. The CPUID vendor string
+        // (EBX, EDX, ECX of leaf 0) is free to read, so skip WMI elsewhere.
+        int regs[4] = {};
+        __cpuid(regs, 0);
+        char vendor[13] = {};
+        memcpy(vendor, &regs[1], 4);
+        memcpy(vendor + 4, &regs[3], 4);
+        memcpy(vendor + 8, &regs[2], 4);
+        if (std::string(vendor) != "AuthenticAMD") {
+            probed = true;
+            return "";
+        }
 
-    // XDNA2 NPU: AMD vendor 1022, device 17F0
-    bool found_xdna2 = false;
-    wmi_conn.query(
-        L"SELECT PNPDeviceID FROM Win32_PnPEntity WHERE PNPDeviceID LIKE '%VEN_1022&DEV_17F0%'",
-        [&found_xdna2](IWbemClassObject* pObj) {
-            found_xdna2 = true;
-        });
+        wmi::WMIConnection wmi_conn;
+        if (!wmi_conn.is_valid()) {
+            return "";
+        }
+
+        // XDNA2 NPU: AMD vendor 1022, device 17F0
+        wmi_conn.query(
+            L"SELECT PNPDeviceID FROM Win32_PnPEntity WHERE PNPDeviceID LIKE '%VEN_1022&DEV_17F0%'",
+            [](IWbemClassObject* pObj) {
+                found_xdna2 = true;
+            });
+        probed = true;
+    }
 
     if (found_xdna2) {
         return "XDNA2";
@@ -2099,12 +2098,9 @@ void SystemInfo::set_rocm_arch_override(const std::string& arch) {
 std::string SystemInfo::rocm_asset_family(const std::string& arch) {
     static const json families = []() -> json {
         try {
-            std::string config_path = utils::get_resource_path("resources/backend_versions.json");
-            std::ifstream file(config_path);
-            if (!file.is_open()) {
-                return json::object();
-            }
-            return json::parse(file).value("rocm_asset_families", json::object());
+            return JsonUtils::load_from_file(
+                utils::get_resource_path("resources/backend_versions.json"))
+                .value("rocm_asset_families", json::object());
         } catch (...) {
             return json::object();
         }
@@ -2121,12 +2117,9 @@ std::string SystemInfo::rocm_asset_family(const std::string& arch) {
 std::string SystemInfo::vllm_rocm_version_override(const std::string& asset_family) {
     static const json overrides = []() -> json {
         try {
-            std::string config_path = utils::get_resource_path("resources/backend_versions.json");
-            std::ifstream file(config_path);
-            if (!file.is_open()) {
-                return json::object();
-            }
-            json vllm = json::parse(file).value("vllm", json::object());
+            json vllm = JsonUtils::load_from_file(
+                utils::get_resource_path("resources/backend_versions.json"))
+                .value("vllm", json::object());
             return vllm.value("rocm_arch_overrides", json::object());
         } catch (...) {
             return json::object();
@@ -2174,23 +2167,39 @@ std::string SystemInfo::get_rocm_arch() {
     if (!g_rocm_arch_override.empty()) {
         return g_rocm_arch_override;
     }
+
+    // Hardware detection runs once per process, so the selected arch never
+    // changes after the first successful lookup. Remember it instead of
+    // copying the whole system-info JSON on every backend load. The lock is
+    // not held while resolving: recipe building re-enters this function.
+    static std::mutex arch_mutex;
+    static std::optional<std::string> cached_arch;
+    {
+        std::lock_guard<std::mutex> lock(arch_mutex);
+        if (cached_arch) {
+            return *cached_arch;
+        }
+    }
+
+    std::string arch;
     try {
         // Use cached system info to avoid re-detecting GPUs
         json system_info = SystemInfoCache::get_system_info_with_cache();
 
-        if (!system_info.contains("devices")) {
-            return "";
-        }
-
-        const auto& devices = system_info["devices"];
-        if (devices.contains("amd_gpu")) {
-            return select_rocm_arch(devices["amd_gpu"]);
+        if (system_info.contains("devices")) {
+            const auto& devices = system_info["devices"];
+            if (devices.contains("amd_gpu")) {
+                arch = select_rocm_arch(devices["amd_gpu"]);
+            }
         }
     } catch (...) {
-        // Detection failed
+        // Detection failed; don't cache so a later call can retry
+        return "";
     }
 
-    return "";  // No supported architecture found
+    std::lock_guard<std::mutex> lock(arch_mutex);
+    cached_arch = arch;
+    return arch;  // Empty if no supported architecture found
 }
 
 static int cuda_sm_value(const std::string& arch) {
@@ -2427,13 +2436,9 @@ static std::vector<NvidiaSmiGpuInfo> query_nvidia_smi() {
         " --query-gpu=index,uuid,name,compute_cap,driver_version,memory.total"
         " --format=csv,noheader,nounits 2>/dev/null";
     for (const char* smi : {"nvidia-smi", "/usr/bin/nvidia-smi"}) {
-        std::string cmd = std::string(smi) + smi_query;
-        FILE* pipe = popen(cmd.c_str(), "r");
-        if (!pipe) continue;
         std::string candidate;
-        char buffer[512];
-        while (fgets(buffer, sizeof(buffer), pipe) != nullptr) candidate += buffer;
-        int rc = pclose(pipe);
+        int rc = lemon::utils::ProcessManager::run_command(
+            std::string(smi) + smi_query, candidate, 10);
         if (rc == 0 && !candidate.empty()) {
             output = candidate;
             break;
@@ -3019,7 +3024,8 @@ void WindowsSystemInfo::load_dxdiag_cache() {
 
     std::string line;
     std::string current_card_lower;
-    std::regex memory_regex(R"((\d+(?:\.\d+)?)\s*MB)", std::regex::icase);
+    // Applied to the already-lowercased line, so no icase folding is needed.
+    static const std::regex memory_regex(R"((\d+(?:\.\d+)?)\s*mb)");
 
     while (std::getline(file, line)) {
         std::string line_lower = line;
@@ -3039,7 +3045,7 @@ void WindowsSystemInfo::load_dxdiag_cache() {
         if (!current_card_lower.empty() &&
             line_lower.find("dedicated memory:") != std::string::npos) {
             std::smatch match;
-            if (std::regex_search(line, match, memory_regex)) {
+            if (std::regex_search(line_lower, match, memory_regex)) {
                 try {
                     double vram_mb = std::stod(match[1].str());
                     double vram_gb = std::round(vram_mb / 1024.0 * 10.0) / 10.0;
@@ -3549,21 +3555,15 @@ std::vector<GPUInfo> LinuxSystemInfo::detect_amd_gpus(const std::string& gpu_typ
 
 std::string LinuxSystemInfo::get_nvidia_driver_version() {
     // Try nvidia-smi first
-    FILE* pipe = popen("nvidia-smi --query-gpu=driver_version --format=csv,noheader,nounits 2>/dev/null", "r");
-    if (pipe) {
-        char buffer[128];
-        if (fgets(buffer, sizeof(buffer), pipe) != nullptr) {
-            std::string version = buffer;
-            // Remove newline
-            if (!version.empty() && version.back() == '\n') {
-                version.pop_back();
-            }
-            pclose(pipe);
-            if (!version.empty() && version != "N/A") {
-                return version;
-            }
+    std::string output;
+    int rc = lemon::utils::ProcessManager::run_command(
+        "nvidia-smi --query-gpu=driver_version --format=csv,noheader,nounits 2>/dev/null", output, 5);
+    if (rc == 0 && !output.empty()) {
+        // First line only; one per GPU
+        std::string version = output.substr(0, output.find('\n'));
+        if (!version.empty() && version != "N/A") {
+            return version;
         }
-        pclose(pipe);
     }
 
     // Fallback: /sys/module/nvidia/version — accessible via hardware-observe interface
@@ -3585,7 +3585,7 @@ std::string LinuxSystemInfo::get_nvidia_driver_version() {
         while (std::getline(file, line)) {
             // Look for "Kernel Module  XXX.XX.XX"
             if (line.find("Kernel Module") != std::string::npos) {
-                std::regex version_regex(R"(Kernel Module\s+(\d+\.\d+(?:\.\d+)?))");
+                static const std::regex version_regex(R"(Kernel Module\s+(\d+\.\d+(?:\.\d+)?))");
                 std::smatch match;
                 if (std::regex_search(line, match, version_regex)) {
                     return match[1].str();
@@ -3598,27 +3598,20 @@ std::string LinuxSystemInfo::get_nvidia_driver_version() {
 }
 
 double LinuxSystemInfo::get_nvidia_vram() {
-    FILE* pipe = popen("nvidia-smi --query-gpu=memory.total --format=csv,noheader,nounits 2>/dev/null", "r");
-    if (!pipe) {
+    std::string output;
+    int rc = lemon::utils::ProcessManager::run_command(
+        "nvidia-smi --query-gpu=memory.total --format=csv,noheader,nounits 2>/dev/null", output, 5);
+    if (rc != 0 || output.empty()) {
         return 0.0;
     }
 
-    char buffer[128];
-    if (fgets(buffer, sizeof(buffer), pipe) != nullptr) {
-        std::string vram_str = buffer;
-        pclose(pipe);
-
-        try {
-            // nvidia-smi returns MB
-            double vram_mb = std::stod(vram_str);
-            return std::round(vram_mb / 1024.0 * 10.0) / 10.0;  // Convert to GB, round to 1 decimal
-        } catch (...) {
-            return 0.0;
-        }
+    try {
+        // nvidia-smi returns MB
+        double vram_mb = std::stod(output);
+        return std::round(vram_mb / 1024.0 * 10.0) / 10.0;  // Convert to GB, round to 1 decimal
+    } catch (...) {
+        return 0.0;
     }
-    pclose(pipe);
-
-    return 0.0;
 }
 
 double LinuxSystemInfo::get_ttm_gb() {
@@ -4067,8 +4060,11 @@ bool SystemInfo::is_running_under_systemd() {
     return false;
 #else
     const char* disable_journal = std::getenv("LEMONADE_DISABLE_SYSTEMD_JOURNAL");
-    if (disable_journal && (std::string(disable_journal) == "1" || std::string(disable_journal) == "true")) {
-        return false;
+    if (disable_journal) {
+        const std::string value(disable_journal);
+        if (value == "1" || value == "true") {
+            return false;
+        }
     }
 
 #ifdef HAVE_SYSTEMD
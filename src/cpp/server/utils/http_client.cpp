@@ -247,6 +247,11 @@ static size_t write_callback(void* contents, size_t size, size_t nmemb, void* us
     return total_size;
 }
 
+// Callback for consuming and dropping response data
+static size_t discard_callback(void* /*contents*/, size_t size, size_t nmemb, void* /*userp*/) {
+    return size * nmemb;
+}
+
 // Callback for writing to file
 static size_t write_file_callback(void* ptr, size_t size, size_t nmemb, void* stream) {
     size_t written = fwrite(ptr, size, nmemb, static_cast<FILE*>(stream));
@@ -1190,13 +1195,13 @@ bool HttpClient::is_reachable(const std::string& url, int timeout_seconds) {
         return false;
     }
 
-    std::string response_body;
-
     curl_easy_setopt(curl, CURLOPT_URL, url.c_str());
     curl_easy_setopt(curl, CURLOPT_TIMEOUT, timeout_seconds);
     curl_easy_setopt(curl, CURLOPT_USERAGENT, "lemon.cpp/1.0");
-    curl_easy_setopt(curl, CURLOPT_WRITEFUNCTION, write_callback);
-    curl_easy_setopt(curl, CURLOPT_WRITEDATA, &response_body);
+    // Only the status code matters here. Readiness probes hit endpoints like
+    // FLM's /api/tags that return the full model list, so drop the body as it
+    // arrives instead of accumulating it into a string nobody reads.
+    curl_easy_setopt(curl, CURLOPT_WRITEFUNCTION, discard_callback);
 
     CURLcode res = curl_easy_perform(curl);
 
@@ -1,21 +1,50 @@
 #include <lemon/utils/json_utils.h>
 #include <lemon/utils/path_utils.h>
 #include <fstream>
+#include <sstream>
 #include <stdexcept>
 #include <vector>
 
 namespace lemon {
 namespace utils {
 
+std::string JsonUtils::read_file_contents(std::ifstream& file) {
+    // Size the buffer from the file length and fill it with a single read,
+    // instead of growing an ostringstream through the streambuf and then
+    // copying it out again. Falls back to the stream copy if the length is
+    // unknown (e.g. a pipe).
+    std::string contents;
+    file.seekg(0, std::ios::end);
+    const std::streamoff size = file.tellg();
+    if (size > 0) {
+        contents.resize(static_cast<size_t>(size));
+        file.seekg(0, std::ios::beg);
+        file.read(&contents[0], size);
+        contents.resize(static_cast<size_t>(file.gcount()));
+    } else {
+        file.clear();
+        file.seekg(0, std::ios::beg);
+        std::ostringstream stream;
+        stream << file.rdbuf();
+        contents = stream.str();
+    }
+    return contents;
+}
+
 json JsonUtils::load_from_file(const std::string& file_path) {
-    std::ifstream file(path_from_utf8(file_path));
+    std::ifstream file(path_from_utf8(file_path), std::ios::binary);
     if (!file.is_open()) {
         throw std::runtime_error("Failed to open file: " + file_path);
     }
 
+    // Read the whole file, then parse from memory. Parsing straight from the
+    // istream goes through the streambuf one character at a time, which is
+    // several times slower for the model registry and user model files.
+    const std::string contents = read_file_contents(file);
+
     json j;
     try {
-        file >> j;
+        j = json::parse(contents);
     } catch (const json::exception& e) {
         throw std::runtime_error("Failed to parse JSON from file " + file_path + ": " + e.what());
     }
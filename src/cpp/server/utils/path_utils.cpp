@@ -54,7 +54,10 @@ std::string path_to_utf8(const fs::path& path) {
 }
 
 std::string get_executable_dir() {
-    return platform()->get_executable_dir();
+    // The executable cannot move while we run, and get_resource_path() asks
+    // for this on every resource lookup, so resolve it once per process.
+    static const std::string exe_dir = platform()->get_executable_dir();
+    return exe_dir;
 }
 
 std::string get_resource_path(const std::string& relative_path) {
@@ -24,7 +24,7 @@ public:
             "unzip",
             {"-o", "-q", zip_path, "-d", dest_dir},
             [&output](const std::string& line) {
-                output += line + "\n";
+                append_extract_diagnostic(output, line);
                 return true;
             },
             "",
@@ -72,7 +72,7 @@ public:
             {"-xf", tarball_path, "-C", dest_dir,
              "--strip-components=" + std::to_string(strip), "--no-same-owner"},
             [&output](const std::string& line) {
-                output += line + "\n";
+                append_extract_diagnostic(output, line);
                 return true;
             },
             "",
@@ -92,17 +92,21 @@ public:
     }
 
     bool is_native_tar_available() override {
-        try {
-            return ProcessManager::run_process_with_output(
-                "tar",
-                {"--version"},
-                [](const std::string&) { return true; },
-                "",
-                5
-            ) == 0;
-        } catch (const std::exception&) {
-            return false;
-        }
+        // Probe once per process: the answer cannot change while we run.
+        static const bool available = []() {
+            try {
+                return ProcessManager::run_process_with_output(
+                    "tar",
+                    {"--version"},
+                    [](const std::string&) { return true; },
+                    "",
+                    5
+                ) == 0;
+            } catch (const std::exception&) {
+                return false;
+            }
+        }();
+        return available;
     }
 };
 
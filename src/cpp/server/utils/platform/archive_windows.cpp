@@ -37,18 +37,23 @@ public:
     }
 
     bool is_native_tar_available() override {
-        std::string tar_path = get_native_tar_path();
-        try {
-            return ProcessManager::run_process_with_output(
-                tar_path,
-                {"--version"},
-                [](const std::string&) { return true; },
-                "",
-                5
-            ) == 0;
-        } catch (const std::exception&) {
-            return false;
-        }
+        // Probe once per process: each extraction asks, and the answer cannot
+        // change while we run, so don't spawn tar --version every time.
+        static const bool available = [this]() {
+            std::string tar_path = get_native_tar_path();
+            try {
+                return ProcessManager::run_process_with_output(
+                    tar_path,
+                    {"--version"},
+                    [](const std::string&) { return true; },
+                    "",
+                    5
+                ) == 0;
+            } catch (const std::exception&) {
+                return false;
+            }
+        }();
+        return available;
     }
     bool extract_zip(const std::string& zip_path,
                     const std::string& dest_dir,
@@ -63,7 +68,7 @@ public:
                 get_native_tar_path(),
                 {"-xf", zip_path, "-C", dest_dir},
                 [&output](const std::string& line) {
-                    output += line + "\n";
+                    append_extract_diagnostic(output, line);
                     return true;
                 },
                 "",
@@ -78,10 +83,11 @@ public:
             }
             result = ProcessManager::run_process_with_output(
                 powershell_path,
-                {"-Command", "Expand-Archive -LiteralPath '" + escape_powershell_literal(zip_path) +
+                {"-NoProfile", "-NonInteractive",
+                 "-Command", "Expand-Archive -LiteralPath '" + escape_powershell_literal(zip_path) +
                  "' -DestinationPath '" + escape_powershell_literal(dest_dir) + "' -Force"},
                 [&output](const std::string& line) {
-                    output += line + "\n";
+                    append_extract_diagnostic(output, line);
                     return true;
                 },
                 "",
@@ -135,7 +141,7 @@ public:
             {"-xf", tarball_path, "-C", dest_dir,
              "--strip-components=" + std::to_string(strip), "--no-same-owner"},
             [&output](const std::string& line) {
-                output += line + "\n";
+                append_extract_diagnostic(output, line);
                 return true;
             },
             "",
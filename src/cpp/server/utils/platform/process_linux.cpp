@@ -13,6 +13,7 @@
 #include <netinet/in.h>
 #include <arpa/inet.h>
 #include <fcntl.h>
+#include <poll.h>
 #include <errno.h>
 #include <cstring>
 #include <thread>
@@ -55,6 +56,46 @@ static void log_process_line(const std::string& line) {
     }
 }
 
+// Drain a filtered child pipe until EOF, logging each complete line. Reads
+// are large and lines are consumed by offset, compacting the buffer once per
+// read instead of reallocating it for every line of a chatty backend.
+static void drain_filtered_output(int fd) {
+    static constexpr size_t READ_CHUNK_SIZE = 64 * 1024;
+    std::vector<char> buffer(READ_CHUNK_SIZE);
+    std::string line_buffer;
+    ssize_t bytes_read;
+
+    while ((bytes_read = read(fd, buffer.data(), buffer.size())) > 0) {
+        line_buffer.append(buffer.data(), static_cast<size_t>(bytes_read));
+
+        size_t start = 0;
+        size_t pos;
+        while ((pos = line_buffer.find('\n', start)) != std::string::npos) {
+            log_process_line(line_buffer.substr(start, pos - start));
+            start = pos + 1;
+        }
+        line_buffer.erase(0, start);
+    }
+
+    if (!line_buffer.empty()) {
+        log_process_line(line_buffer);
+    }
+
+    close(fd);
+}
+
+// Grow a pipe buffer (default 64 KiB) so a chatty backend does not block on
+// write while the filter thread is busy logging. Best-effort: the kernel caps
+// the size at /proc/sys/fs/pipe-max-size for unprivileged processes.
+static void enlarge_pipe(int fd) {
+#ifdef F_SETPIPE_SZ
+    static constexpr int PIPE_BUFFER_SIZE = 1 << 20;
+    fcntl(fd, F_SETPIPE_SZ, PIPE_BUFFER_SIZE);
+#else
+    (void)fd;
+#endif
+}
+
 #ifdef HAVE_LIBCAP
 static void preserve_capabilities_for_exec() {
     cap_t caps = cap_get_proc();
@@ -219,11 +260,15 @@ ProcessHandle LinuxProcessPlatform::spawn(
     int stdout_pipe[2] = {-1, -1};
     int stderr_pipe[2] = {-1, -1};
 
-    // Create pipes for filtering if requested
+    // Create pipes for filtering if requested. O_CLOEXEC keeps these fds from
+    // leaking into other children spawned concurrently (the child gets its own
+    // copies via dup2, which clears the flag).
     if (inherit_output && filter_health_logs) {
-        if (pipe(stdout_pipe) < 0 || pipe(stderr_pipe) < 0) {
+        if (pipe2(stdout_pipe, O_CLOEXEC) < 0 || pipe2(stderr_pipe, O_CLOEXEC) < 0) {
             throw std::runtime_error("Failed to create pipes for output filtering");
         }
+        enlarge_pipe(stdout_pipe[1]);
+        enlarge_pipe(stderr_pipe[1]);
     }
 
     if (inherit_output) {
@@ -252,53 +297,9 @@ ProcessHandle LinuxProcessPlatform::spawn(
         close(stdout_pipe[1]);
         close(stderr_pipe[1]);
 
-        std::thread([fd = stdout_pipe[0]]() {
-            char buffer[4096];
-            std::string line_buffer;
-            ssize_t bytes_read;
-
-            while ((bytes_read = read(fd, buffer, sizeof(buffer) - 1)) > 0) {
-                buffer[bytes_read] = '\0';
-                line_buffer += buffer;
-
-                size_t pos;
-                while ((pos = line_buffer.find('\n')) != std::string::npos) {
-                    std::string line = line_buffer.substr(0, pos);
-                    line_buffer = line_buffer.substr(pos + 1);
-                    log_process_line(line);
-                }
-            }
+        std::thread(drain_filtered_output, stdout_pipe[0]).detach();
 
-            if (!line_buffer.empty()) {
-                log_process_line(line_buffer);
-            }
-
-            close(fd);
-        }).detach();
-
-        std::thread([fd = stderr_pipe[0]]() {
-            char buffer[4096];
-            std::string line_buffer;
-            ssize_t bytes_read;
-
-            while ((bytes_read = read(fd, buffer, sizeof(buffer) - 1)) > 0) {
-                buffer[bytes_read] = '\0';
-                line_buffer += buffer;
-
-                size_t pos;
-                while ((pos = line_buffer.find('\n')) != std::string::npos) {
-                    std::string line = line_buffer.substr(0, pos);
-                    line_buffer = line_buffer.substr(pos + 1);
-                    log_process_line(line);
-                }
-            }
-
-            if (!line_buffer.empty()) {
-                log_process_line(line_buffer);
-            }
-
-            close(fd);
-        }).detach();
+        std::thread(drain_filtered_output, stderr_pipe[0]).detach();
     }
 
     return handle;
@@ -502,7 +503,7 @@ int LinuxProcessPlatform::run_with_output(
 
     int stdout_pipe[2];
 
-    if (pipe(stdout_pipe) < 0) {
+    if (pipe2(stdout_pipe, O_CLOEXEC) < 0) {
         throw std::runtime_error("Failed to create pipe");
     }
 
@@ -676,17 +677,108 @@ int LinuxProcessPlatform::find_free_port(int start_port) {
 int LinuxProcessPlatform::run_command(const std::string& command, std::string& output, int timeout_seconds) {
     output.clear();
 
-    FILE* pipe = popen(command.c_str(), "r");
-    if (!pipe) {
+    // Like popen(), but bounded by timeout_seconds: a wedged tool (e.g. nvidia-smi
+    // behind a hung driver) is killed instead of blocking the caller forever.
+    int stdout_pipe[2];
+    if (pipe2(stdout_pipe, O_CLOEXEC) < 0) {
+        return -1;
+    }
+
+    pid_t pid = fork();
+    if (pid < 0) {
+        close(stdout_pipe[0]);
+        close(stdout_pipe[1]);
         return -1;
     }
 
+    if (pid == 0) {
+        // Own process group, so a timeout kill also reaches the shell's children.
+        setpgid(0, 0);
+        prctl(PR_SET_PDEATHSIG, SIGTERM);
+        dup2(stdout_pipe[1], STDOUT_FILENO);
+        close(stdout_pipe[0]);
+        close(stdout_pipe[1]);
+        execl("/bin/sh", "sh", "-c", command.c_str(), static_cast<char*>(nullptr));
+        _exit(127);
+    }
+
+    close(stdout_pipe[1]);
+
+    const auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(timeout_seconds);
+    // Set on timeout and on any pipe error: either way we stop reading and
+    // must kill the child, or the waitpid() below could block forever.
+    bool abandoned = false;
     char buf[4096];
-    while (fgets(buf, sizeof(buf), pipe)) {
-        output += buf;
+    while (true) {
+        int wait_ms = -1;
+        if (timeout_seconds > 0) {
+            auto remaining = std::chrono::duration_cast<std::chrono::milliseconds>(
+                deadline - std::chrono::steady_clock::now()).count();
+            if (remaining <= 0) {
+                abandoned = true;
+                break;
+            }
+            wait_ms = static_cast<int>(remaining);
+        }
+
+        pollfd pfd = {stdout_pipe[0], POLLIN, 0};
+        int ready = poll(&pfd, 1, wait_ms);
+        if (ready < 0) {
+            if (errno == EINTR) continue;
+            abandoned = true;
+            break;
+        }
+        if (ready == 0) {
+            abandoned = true;
+            break;
+        }
+
+        ssize_t n = read(stdout_pipe[0], buf, sizeof(buf));
+        if (n > 0) {
+            output.append(buf, static_cast<size_t>(n));
+        } else if (n == 0) {
+            break;
+        } else if (errno != EINTR) {
+            abandoned = true;
+            break;
+        }
     }
 
-    return pclose(pipe);
+    close(stdout_pipe[0]);
+    if (abandoned) {
+        ::kill(-pid, SIGKILL);
+    }
+
+    int status = 0;
+    if (timeout_seconds <= 0) {
+        while (waitpid(pid, &status, 0) < 0 && errno == EINTR) {}
+        return WIFEXITED(status) ? WEXITSTATUS(status) : -1;
+    }
+
+    // Reap against the same deadline (plus a short grace after a kill): a child
+    // can close stdout and keep running, and one stuck in an uninterruptible
+    // driver call ignores SIGKILL until that call returns. Never block the
+    // caller on it; an unreaped child is left to a detached waiter.
+    const auto reap_deadline = abandoned
+        ? std::chrono::steady_clock::now() + std::chrono::seconds(1)
+        : deadline;
+    pid_t reaped;
+    while ((reaped = waitpid(pid, &status, WNOHANG)) == 0 ||
+           (reaped < 0 && errno == EINTR)) {
+        if (std::chrono::steady_clock::now() >= reap_deadline) {
+            ::kill(-pid, SIGKILL);
+            std::thread([pid]() {
+                int ignored = 0;
+                while (waitpid(pid, &ignored, 0) < 0 && errno == EINTR) {}
+            }).detach();
+            return -1;
+        }
+        std::this_thread::sleep_for(std::chrono::milliseconds(10));
+    }
+    if (abandoned || reaped < 0) {
+        return -1;
+    }
+    return WIFEXITED(status) ? WEXITSTATUS(status) : -1;
 }
 
 std::unique_ptr<ProcessPlatform> create_process_platform() {
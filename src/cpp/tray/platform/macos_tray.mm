@@ -2,6 +2,7 @@
 
 #include "lemon_tray/platform/macos_tray.h"
 
+#include <atomic>
 #include <iostream>
 #include <lemon/utils/aixlog.hpp>
 #include <memory>
@@ -267,18 +268,46 @@ void MacOSTray::show_notification(const std::string& title, const std::string& m
     if ([[NSBundle mainBundle] bundleIdentifier] != nil) {
         if (@available(macOS 10.14, *)) {
             UNUserNotificationCenter *center = [UNUserNotificationCenter currentNotificationCenter];
-            [center requestAuthorizationWithOptions:(UNAuthorizationOptionAlert | UNAuthorizationOptionSound)
-                                  completionHandler:^(BOOL granted, NSError * _Nullable error) {
-                if (granted) {
-                    UNMutableNotificationContent *content = [[UNMutableNotificationContent alloc] init];
-                    content.title = nsTitle;
-                    content.body = nsMessage;
-
-                    NSString *uuid = [[NSUUID UUID] UUIDString];
-                    UNNotificationRequest *request = [UNNotificationRequest requestWithIdentifier:uuid content:content trigger:nil];
-                    [center addNotificationRequest:request withCompletionHandler:nil];
-                }
-            }];
+            void (^post)(void) = ^{
+                UNMutableNotificationContent *content = [[UNMutableNotificationContent alloc] init];
+                content.title = nsTitle;
+                content.body = nsMessage;
+
+                NSString *uuid = [[NSUUID UUID] UUIDString];
+                UNNotificationRequest *request = [UNNotificationRequest requestWithIdentifier:uuid content:content trigger:nil];
+                [center addNotificationRequest:request withCompletionHandler:nil];
+            };
+
+            // Only a grant is remembered: once authorized, post directly instead
+            // of a round-trip to the notification daemon for every load/unload
+            // notification. Otherwise read the current settings (no prompt), so
+            // enabling notifications in System Settings takes effect without
+            // restarting the tray, and prompt only while the user hasn't decided.
+            static std::atomic<bool> authorized{false};
+            if (authorized.load()) {
+                post();
+            } else {
+                [center getNotificationSettingsWithCompletionHandler:^(UNNotificationSettings * _Nonnull settings) {
+                    switch (settings.authorizationStatus) {
+                        case UNAuthorizationStatusAuthorized:
+                        case UNAuthorizationStatusProvisional:
+                            authorized.store(true);
+                            post();
+                            break;
+                        case UNAuthorizationStatusNotDetermined:
+                            [center requestAuthorizationWithOptions:(UNAuthorizationOptionAlert | UNAuthorizationOptionSound)
+                                                  completionHandler:^(BOOL granted, NSError * _Nullable error) {
+                                if (granted) {
+                                    authorized.store(true);
+                                    post();
+                                }
+                            }];
+                            break;
+                        default:
+                            break;
+                    }
+                }];
+            }
         }
     }
         // 2. CLI/Debug Mode (No Bundle ID) - Uses Deprecated API safely
@@ -286,7 +286,12 @@ void TrayUI::build_menu() {
 
     // Fetch once, use for both the menu and the cache
     auto [reachable, loaded_models] = fetch_server_state();
-    auto available_models = get_downloaded_models();
+    apply_menu(reachable, std::move(loaded_models), get_downloaded_models());
+}
+
+void TrayUI::apply_menu(bool reachable,
+                        std::vector<LoadedModelInfo> loaded_models,
+                        std::vector<ModelInfo> available_models) {
     if (reachable) fetch_runtime_config();
 
     Menu menu = create_menu(loaded_models, available_models);
@@ -300,21 +305,22 @@ void TrayUI::build_menu() {
 
 void TrayUI::refresh_menu() {
     if (!tray_) return;
-    if (menu_needs_refresh()) {
-        build_menu();
-    }
-}
 
-bool TrayUI::menu_needs_refresh() {
     // Fetch outside the lock to avoid blocking other threads during HTTP calls
     auto [reachable, loaded] = fetch_server_state();
-    auto current_available = get_downloaded_models();
+    auto available = get_downloaded_models();
 
-    std::lock_guard<std::mutex> lock(state_mutex_);
-    if (reachable != last_menu_server_reachable_) return true;
-    if (loaded != last_menu_loaded_models_) return true;
-    if (current_available != last_menu_available_models_) return true;
-    return false;
+    {
+        std::lock_guard<std::mutex> lock(state_mutex_);
+        if (reachable == last_menu_server_reachable_ &&
+            loaded == last_menu_loaded_models_ &&
+            available == last_menu_available_models_) {
+            return;  // Nothing changed; keep the current menu
+        }
+    }
+
+    // Rebuild from the state just fetched instead of querying the server again
+    apply_menu(reachable, std::move(loaded), std::move(available));
 }
 
 Menu TrayUI::create_menu(const std::vector<LoadedModelInfo>& loaded_models,